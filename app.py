@@ -1,4 +1,4 @@
-from flask import Flask
+from flask import Flask, Request
 from flask_jwt_extended import JWTManager
 from flask_sqlalchemy import SQLAlchemy
 from flask_session import Session
@@ -6,6 +6,8 @@ from flask_restful import Api
 from flask_migrate import Migrate
 from config import Config
 import os
+import logging
+from tempfile import SpooledTemporaryFile
 
 from model import db, TokenBlocklist  # Ensure TokenBlocklist is imported
 from flask_cors import CORS
@@ -14,21 +16,56 @@ from auth.routes import auth_bp
 from auth.admin import admin_bp
 from auth.oauth import oauth_bp
 from auth.profile import profile_bp
+from auth.utils import prune_token_blocklist
 
 # Import your other resource registration functions
 from product import register_product_resources
 from order import register_order_resources
 from payment import register_payment_resources
 from report import register_report_resources
-from custom_image import register_custom_image_resources
+from custom_image import (
+    register_custom_image_resources, MAX_CONTENT_LENGTH, MAX_BATCH_CONTENT_LENGTH, BATCH_UPLOAD_ENDPOINT
+)
 from pickup_point import register_pickup_point_resources
 from email_utils import mail
+from json_utils import output_json, ORJSONProvider
 import cloudinary
+from cloudinary_utils import configure_http_pools
+
+UPLOAD_SPOOL_SIZE = 1024 * 1024  # bytes of each uploaded file part kept in memory
+
+# Configure logging once for the whole application
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+class UploadRequest(Request):
+    """Request with per-endpoint body limits and in-memory upload buffering.
+
+    Only the batch upload endpoint accepts bodies up to
+    MAX_BATCH_CONTENT_LENGTH; every other endpoint keeps the app-wide
+    MAX_CONTENT_LENGTH. Uploaded file parts stay in memory up to
+    UPLOAD_SPOOL_SIZE and larger parts spill to a temporary file, so a
+    request thread never buffers several full-size images in memory.
+    """
+
+    @property
+    def max_content_length(self):
+        if self.endpoint == BATCH_UPLOAD_ENDPOINT:
+            return MAX_BATCH_CONTENT_LENGTH
+        return super().max_content_length
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE, mode="rb+")
 
 # Initialize Flask app
 app = Flask(__name__)
+app.request_class = UploadRequest
+app.json = ORJSONProvider(app)
 app.config.from_object(Config)
 
+# Werkzeug answers larger bodies with 413 before parsing them; the batch
+# upload endpoint raises the limit in UploadRequest
+app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
+
 # Set database config
 DATABASE_URL = os.getenv("EXTERNAL_DATABASE_URL")
 if not DATABASE_URL:
@@ -53,6 +90,7 @@ app.config['SESSION_SQLALCHEMY'] = db
 db.init_app(app)
 Session(app)
 api = Api(app)
+api.representations['application/json'] = output_json
 jwt = JWTManager(app)
 migrate = Migrate(app, db)
 mail.init_app(app)
@@ -63,6 +101,7 @@ cloudinary.config(
     api_key=os.getenv('CLOUDINARY_API_KEY'),
     api_secret=os.getenv('CLOUDINARY_API_SECRET')
 )
+configure_http_pools()
 
 # CORS setup
 CORS(app,
@@ -85,8 +124,12 @@ CORS(app,
 @jwt.token_in_blocklist_loader
 def check_if_token_revoked(jwt_header, jwt_payload):
     jti = jwt_payload["jti"]
-    token = TokenBlocklist.query.filter_by(jti=jti).first()
-    return token is not None
+    return db.session.query(TokenBlocklist.query.filter_by(jti=jti).exists()).scalar()
+
+@app.cli.command("prune-token-blocklist")
+def prune_token_blocklist_command():
+    """Delete revoked-token entries older than the token lifetime."""
+    prune_token_blocklist()
 
 # Register blueprints
 app.register_blueprint(admin_bp, url_prefix="/auth")
@@ -6,6 +6,7 @@ import logging
 from datetime import datetime
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
+from sqlalchemy.orm import selectinload
 
 from .utils import (
     is_valid_email, is_valid_phone, validate_password, 
@@ -69,7 +70,7 @@ def register_admin():
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Admin registration error: {str(e)}")
+        logger.error("Admin registration error: %s", e)
         return jsonify({"msg": "Admin registration failed", "error": str(e)}), 500
 
 @admin_bp.route('/staff/register', methods=['POST'])
@@ -127,7 +128,7 @@ def register_staff():
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Staff registration error: {str(e)}")
+        logger.error("Staff registration error: %s", e)
         return jsonify({"msg": "Staff registration failed", "error": str(e)}), 500
 
 @admin_bp.route('/users', methods=['GET'])
@@ -140,7 +141,8 @@ def get_users():
         role_filter = request.args.get('role', '').strip().upper()
         is_active_filter = request.args.get('is_active', '').strip().lower()
 
-        query = User.query
+        # as_dict reads permissions; load them for the whole list in one query
+        query = User.query.options(selectinload(User.permission_rows))
 
         if search_query:
             query = query.filter(
@@ -163,7 +165,7 @@ def get_users():
         return jsonify(result), 200
 
     except Exception as e:
-        logger.error(f"Error fetching users: {str(e)}")
+        logger.error("Error fetching users: %s", e)
         return jsonify({"msg": "Failed to fetch users", "error": str(e)}), 500
 
 @admin_bp.route('/users/<user_id>', methods=['GET'])
@@ -195,7 +197,7 @@ def activate_user(user_id):
         return jsonify({"msg": "User activated successfully"}), 200
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error activating user: {str(e)}")
+        logger.error("Error activating user: %s", e)
         return jsonify({"msg": "Failed to activate user"}), 500
 
 @admin_bp.route('/users/<user_id>/deactivate', methods=['PUT'])
@@ -218,7 +220,7 @@ def deactivate_user(user_id):
         return jsonify({"msg": "User deactivated successfully"}), 200
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error deactivating user: {str(e)}")
+        logger.error("Error deactivating user: %s", e)
         return jsonify({"msg": "Failed to deactivate user"}), 500
 
 @admin_bp.route('/users/<user_id>/permissions', methods=['PUT'])
@@ -241,7 +243,7 @@ def update_user_permissions(user_id):
         return jsonify({"msg": "User permissions updated successfully"}), 200
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error updating user permissions: {str(e)}")
+        logger.error("Error updating user permissions: %s", e)
         return jsonify({"msg": "Failed to update user permissions"}), 500
     
 @admin_bp.route('/register-first-admin', methods=['POST'])
@@ -296,10 +298,10 @@ def register_first_admin():
         db.session.add(new_admin)
         db.session.commit()
 
-        logger.info(f"First admin user created: {email}")
+        logger.info("First admin user created: %s", email)
         return jsonify({"msg": "First admin registered successfully"}), 201
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"First admin registration error: {str(e)}")
+        logger.error("First admin registration error: %s", e)
         return jsonify({"msg": "First admin registration failed", "error": str(e)}), 500
\ No newline at end of file
@@ -2,9 +2,10 @@
 """Authentication decorators"""
 
 from functools import wraps
-from flask import jsonify
+from flask import jsonify, g
 from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
 import logging
+from model import UserRole
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +16,7 @@ def role_required(required_role):
         def wrapper(*args, **kwargs):
             verify_jwt_in_request()
             claims = get_jwt()
-            logger.debug(f"DEBUG: Claims retrieved: {claims}")
+            logger.debug("DEBUG: Claims retrieved: %s", claims)
 
             if "role" not in claims or claims["role"].upper() != required_role.upper():
                 return jsonify({"msg": "Forbidden: Access Denied"}), 403
@@ -41,4 +42,45 @@ def permission_required(permission):
 
             return fn(*args, **kwargs)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+def _claims_role():
+    """Role of the authenticated user, read from the JWT claims set at login"""
+    try:
+        return UserRole(get_jwt()["role"].upper())
+    except (KeyError, AttributeError, ValueError):
+        return None
+
+def require_user(fn):
+    """Flask-RESTful decorator: require a JWT with a valid role claim.
+
+    Stores the caller's id and role on g.current_user_id and g.current_role
+    without loading the User row.
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        verify_jwt_in_request()
+        role = _claims_role()
+
+        if role is None:
+            return {"message": "Invalid token claims"}, 401
+
+        g.current_user_id = get_jwt_identity()
+        g.current_role = role
+        return fn(*args, **kwargs)
+    return wrapper
+
+def require_admin(fn):
+    """Flask-RESTful decorator: like require_user, but only for admins"""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        verify_jwt_in_request()
+        role = _claims_role()
+
+        if role != UserRole.ADMIN:
+            return {"message": "Only admins can access this endpoint"}, 403
+
+        g.current_user_id = get_jwt_identity()
+        g.current_role = role
+        return fn(*args, **kwargs)
+    return wrapper
@@ -5,11 +5,10 @@ import uuid
 import logging
 from datetime import datetime
 from flask import Blueprint, jsonify, request, session, redirect
-from werkzeug.security import generate_password_hash
 
 from .utils import generate_token
 from .decorators import role_required
-from model import db, User, UserRole
+from model import db, User, UserRole, hash_password, new_id
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -56,10 +55,10 @@ def google_callback():
 
         if not user:
             user = User(
-                id=str(uuid.uuid4()),
+                id=new_id(),
                 email=email,
                 name=name,
-                password=generate_password_hash(str(uuid.uuid4())),
+                password=hash_password(str(uuid.uuid4())),
                 role=UserRole.CUSTOMER,
                 is_active=True,
                 created_at=datetime.utcnow(),
@@ -94,5 +93,5 @@ def google_callback():
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error in Google callback: {str(e)}")
+        logger.error("Error in Google callback: %s", e)
         return jsonify({"error": str(e)}), 500
\ No newline at end of file
@@ -36,16 +36,16 @@ def update_profile():
         return jsonify({"msg": "User not found"}), 404
 
     data = request.get_json()
-    logger.info(f"Received data: {data}")  # Log the incoming data
+    logger.info("Received data: %s", data)  # Log the incoming data
 
     try:
         if 'name' in data:
             user.name = data['name'].strip()
-            logger.info(f"Updated name: {user.name}")
+            logger.info("Updated name: %s", user.name)
 
         if 'email' in data:
             user.email = data['email'].strip()
-            logger.info(f"Updated email: {user.email}")
+            logger.info("Updated email: %s", user.email)
 
         if 'phone' in data:
             phone = data['phone'].strip() if data['phone'] else None
@@ -53,15 +53,15 @@ def update_profile():
                 logger.error("Invalid phone number format")
                 return jsonify({"msg": "Invalid phone number format"}), 400
             user.phone = normalize_phone(phone) if phone else None
-            logger.info(f"Updated phone: {user.phone}")
+            logger.info("Updated phone: %s", user.phone)
 
         if 'address' in data:
             user.address = data['address'].strip() if data['address'] else None
-            logger.info(f"Updated address: {user.address}")
+            logger.info("Updated address: %s", user.address)
 
         if 'city' in data:
             user.city = data['city'].strip() if data['city'] else None
-            logger.info(f"Updated city: {user.city}")
+            logger.info("Updated city: %s", user.city)
 
         if 'pickup_point_id' in data:
             pickup_point_id = data['pickup_point_id']
@@ -70,7 +70,7 @@ def update_profile():
                 logger.error("Pickup point not found")
                 return jsonify({"msg": "Pickup point not found"}), 404
             user.pickup_point_id = pickup_point_id
-            logger.info(f"Updated pickup point ID: {user.pickup_point_id}")
+            logger.info("Updated pickup point ID: %s", user.pickup_point_id)
 
         user.updated_at = datetime.utcnow()
         db.session.commit()
@@ -80,7 +80,7 @@ def update_profile():
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Profile update error: {str(e)}", exc_info=True)
+        logger.error("Profile update error: %s", e, exc_info=True)
         return jsonify({"msg": "Failed to update profile", "error": str(e)}), 500
 
 
@@ -114,7 +114,7 @@ def change_password():
         return jsonify({"msg": "Password changed successfully"}), 200
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Password change error: {str(e)}")
+        logger.error("Password change error: %s", e)
         return jsonify({"msg": "Failed to change password"}), 500
 
 @profile_bp.route('/me', methods=['GET'])
@@ -161,7 +161,7 @@ def logout_all_devices():
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Logout all devices failed: {str(e)}")
+        logger.error("Logout all devices failed: %s", e)
         return jsonify({"msg": "Logout all failed", "error": str(e)}), 500
 
 @profile_bp.route('/delete-account', methods=['DELETE'])
@@ -192,5 +192,5 @@ def delete_account():
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error deleting account: {str(e)}")
+        logger.error("Error deleting account: %s", e)
         return jsonify({"msg": "Failed to delete account", "error": str(e)}), 500
@@ -41,7 +41,7 @@ def register():
         return jsonify({"msg": "Invalid email address"}), 400
 
     if phone and not is_valid_phone(phone):
-        logger.error(f"Invalid phone number: {phone}")
+        logger.error("Invalid phone number: %s", phone)
         return jsonify({"msg": "Invalid phone number format"}), 400
 
     if not validate_password(password):
@@ -67,7 +67,7 @@ def register():
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Registration error: {str(e)}")
+        logger.error("Registration error: %s", e)
         return jsonify({"msg": "Registration failed", "error": str(e)}), 500
 
 @auth_bp.route('/login', methods=['POST'])
@@ -151,7 +151,7 @@ def forgot_password():
         mail.send(msg)
         return jsonify({"msg": "Reset link sent to your email"}), 200
     except Exception as e:
-        logger.error(f"Failed to send reset email: {str(e)}")
+        logger.error("Failed to send reset email: %s", e)
         return jsonify({"msg": "Failed to send reset email"}), 500
 
 @auth_bp.route('/reset-password/<token>', methods=['GET', 'POST'])
@@ -162,7 +162,7 @@ def reset_password(token):
     try:
         email = serializer.loads(token, salt="reset-password-salt", max_age=3600)
     except Exception as e:
-        logger.error(f"Token validation error: {e}")
+        logger.error("Token validation error: %s", e)
         return jsonify({"msg": "Invalid or expired token"}), 400
 
     if request.method == 'GET':
@@ -184,6 +184,6 @@ def reset_password(token):
         db.session.commit()
         return jsonify({"msg": "Password reset successful"}), 200
     except Exception as e:
-        logger.error(f"Error updating password: {e}")
+        logger.error("Error updating password: %s", e)
         db.session.rollback()
         return jsonify({"msg": "An error occurred while updating the password"}), 500
\ No newline at end of file
@@ -9,10 +9,11 @@ from werkzeug.security import generate_password_hash
 from flask_jwt_extended import create_access_token
 from datetime import timedelta
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Lifetime of every access token generate_token issues
+ACCESS_TOKEN_EXPIRES = timedelta(days=30)
+
 def generate_token(user):
     """Generate JWT token with user claims"""
     return create_access_token(
@@ -23,9 +24,25 @@ def generate_token(user):
             "name": user.name,
             "permissions": user.permissions
         },
-        expires_delta=timedelta(days=30)
+        expires_delta=ACCESS_TOKEN_EXPIRES
     )
 
+def prune_token_blocklist():
+    """Delete blocklist entries older than the access token lifetime.
+
+    A token revoked that long ago has expired on its own, so its jti no
+    longer needs checking. Returns the number of entries removed.
+    """
+    from model import db, TokenBlocklist
+    from sqlalchemy import delete
+    from datetime import datetime
+
+    cutoff = datetime.utcnow() - ACCESS_TOKEN_EXPIRES
+    result = db.session.execute(delete(TokenBlocklist).where(TokenBlocklist.created_at < cutoff))
+    db.session.commit()
+    logger.info("Pruned %s expired token blocklist entries", result.rowcount)
+    return result.rowcount
+
 def is_valid_email(email: str) -> bool:
     """Validates an email address"""
     try:
@@ -37,10 +54,10 @@ def is_valid_email(email: str) -> bool:
 def normalize_phone(phone: str) -> str:
     """Converts phone numbers to a standard format"""
     if not isinstance(phone, str):
-        logger.warning(f"Phone number is not a string: {phone}")
+        logger.warning("Phone number is not a string: %s", phone)
         phone = str(phone)
 
-    logger.info(f"Normalizing phone number: {phone}")
+    logger.info("Normalizing phone number: %s", phone)
     phone = re.sub(r"\D", "", phone)
 
     if phone.startswith("+254"):
@@ -48,7 +65,7 @@ def normalize_phone(phone: str) -> str:
     elif phone.startswith("254") and len(phone) == 12:
         phone = "0" + phone[3:]
 
-    logger.info(f"Normalized phone number: {phone}")
+    logger.info("Normalized phone number: %s", phone)
     return phone
 
 def is_valid_phone(phone: str, region="KE") -> bool:
@@ -59,17 +76,17 @@ def is_valid_phone(phone: str, region="KE") -> bool:
     phone = normalize_phone(phone)
 
     if len(phone) not in [9, 10]:
-        logger.warning(f"Invalid length for phone number: {phone}")
+        logger.warning("Invalid length for phone number: %s", phone)
         return False
 
     try:
         parsed_number = pn.parse(phone, region)
         if not pn.is_valid_number(parsed_number):
-            logger.warning(f"Invalid phone number format: {phone}")
+            logger.warning("Invalid phone number format: %s", phone)
             return False
         return True
     except pn.phonenumberutil.NumberParseException:
-        logger.warning(f"Failed to parse phone number: {phone}")
+        logger.warning("Failed to parse phone number: %s", phone)
         return False
 
 
@@ -80,12 +97,11 @@ def validate_password(password: str) -> bool:
 
 def create_user_dict(email, name, phone=None, address=None, county=None, role=None, permissions=None):
     """Create a standardized user dictionary for user creation"""
-    from model import UserRole
-    import uuid
+    from model import UserRole, new_id
     from datetime import datetime
     
     return {
-        'id': str(uuid.uuid4()),
+        'id': new_id(),
         'email': email,
         'name': name,
         'phone': normalize_phone(phone) if phone else None,
@@ -0,0 +1,126 @@
+import re
+import threading
+import time
+import random
+import logging
+import cloudinary
+import cloudinary.api_client.call_api
+import cloudinary.uploader
+import cloudinary.utils
+from cloudinary.exceptions import Error as CloudinaryError, GeneralError, RateLimited
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Space calls at least 1 / max_per_second seconds apart across threads."""
+
+    def __init__(self, max_per_second):
+        self.min_interval = 1.0 / max_per_second if max_per_second > 0 else 0.0
+        self.last_call_ts = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        # Reserve the next free slot under the lock, then sleep outside it so
+        # other threads can queue up behind us without serializing the sleep.
+        with self._lock:
+            now = time.monotonic()
+            call_ts = max(now, self.last_call_ts + self.min_interval)
+            self.last_call_ts = call_ts
+
+        delay = call_ts - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+_semaphore = threading.BoundedSemaphore(Config.CLOUDINARY_MAX_CONCURRENCY)
+_rate_limiter = RateLimiter(Config.CLOUDINARY_MAX_RPS)
+
+
+def _pooled_http():
+    """urllib3 pool that keeps one connection per allowed concurrent call alive.
+
+    The SDK's default pool keeps a single connection per host, so parallel
+    calls open fresh TLS connections and discard them afterwards.
+    """
+    return cloudinary.utils.get_http_connector(
+        cloudinary.config(),
+        dict(cloudinary.CERT_KWARGS, maxsize=Config.CLOUDINARY_MAX_CONCURRENCY)
+    )
+
+
+# Upload API (upload, destroy, rename) and Admin API (delete_resources) clients
+_HTTP_CLIENT_MODULES = (cloudinary.uploader, cloudinary.api_client.call_api)
+
+
+def configure_http_pools():
+    """Swap the SDK's module-level HTTP clients for pools sized to the concurrency cap.
+
+    Call after cloudinary.config() so the pools pick up the configured proxy
+    and credentials. The SDK keeps these clients in private attributes; if an
+    upgrade moves them, fail at startup instead of silently keeping the
+    single-connection default.
+    """
+    for module in _HTTP_CLIENT_MODULES:
+        if not hasattr(module, '_http'):
+            raise RuntimeError(f"{module.__name__} has no _http client; check the cloudinary SDK version")
+        module._http = _pooled_http()
+
+MAX_ATTEMPTS = 3
+BACKOFF_BASE = 0.5  # seconds
+BACKOFF_MAX = 4.0  # seconds
+BACKOFF_JITTER = 0.25  # seconds
+
+# HTTP statuses worth retrying: rate limits and server-side failures
+_RETRY_STATUSES = frozenset({420, 429, 500, 502, 503, 504})
+# The SDK has exception classes for the statuses it expects (RateLimited for
+# 420, GeneralError for 500, ...) and reports any other status in this form.
+_UNEXPECTED_STATUS = re.compile(r"^Server returned unexpected status code - (\d{3})\b")
+
+
+def _is_transient(error):
+    """Whether a Cloudinary SDK error is a rate limit, a 5xx or a network failure."""
+    match = _UNEXPECTED_STATUS.match(str(error))
+    if match:
+        return int(match.group(1)) in _RETRY_STATUSES
+    if isinstance(error, (RateLimited, GeneralError)):
+        return True
+    # Timeouts and connection failures are re-raised by the SDK as its own
+    # Error from inside the except block that caught the urllib3 or socket error.
+    cause = error.__cause__ or error.__context__
+    return isinstance(cause, (Urllib3HTTPError, OSError))
+
+
+def _rewind(args, kwargs):
+    """Seek file arguments back to the start so a retry re-sends the whole body."""
+    for value in (*args, *kwargs.values()):
+        if hasattr(value, 'seek'):
+            value.seek(0)
+
+
+def cloudinary_call(fn, *args, **kwargs):
+    """Run a Cloudinary SDK call under the process-wide concurrency and rate limits.
+
+    Rate-limit, 5xx and network errors are retried up to MAX_ATTEMPTS times
+    with jittered exponential backoff; any other error is raised immediately.
+    File arguments are rewound before every attempt, since the SDK reads
+    them to the end on the first one.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            _rewind(args, kwargs)
+            with _semaphore:
+                _rate_limiter.wait()
+                return fn(*args, **kwargs)
+        except CloudinaryError as e:
+            if attempt == MAX_ATTEMPTS - 1 or not _is_transient(e):
+                raise
+
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) + random.random() * BACKOFF_JITTER
+            logger.warning(
+                "Transient Cloudinary error on attempt %s/%s, retrying in %.2fs: %s",
+                attempt + 1, MAX_ATTEMPTS, delay, e
+            )
+            time.sleep(delay)
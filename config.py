@@ -50,5 +50,17 @@ class Config:
     SESSION_COOKIE_SAMESITE = "Lax"
     PERMANENT_SESSION_LIFETIME = 86400  # 24 hours
 
+    # Password hashing: "argon2" or a werkzeug method string; tests can use a
+    # cheap method such as "pbkdf2:sha256:1000" to avoid paying for argon2
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "argon2")
+    PASSWORD_HASH_SALT_LENGTH = int(os.getenv("PASSWORD_HASH_SALT_LENGTH", "16"))
+    ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "2"))
+    ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", str(64 * 1024)))
+    ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "1"))
+
+    # Cloudinary request limits (per process)
+    CLOUDINARY_MAX_CONCURRENCY = int(os.getenv("CLOUDINARY_MAX_CONCURRENCY", "10"))
+    CLOUDINARY_MAX_RPS = float(os.getenv("CLOUDINARY_MAX_RPS", "20"))
+
     # Frontend URL fallback
     FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:5173')
@@ -1,60 +1,256 @@
-import json
-import uuid
 import os
-from flask import request, jsonify
+import uuid
+from flask import request, g, url_for
 from flask_restful import Resource
 from datetime import datetime
-from werkzeug.utils import secure_filename
-from model import db, CustomImage, OrderItem, Order, Product, User, UserRole, ImageApprovalStatus
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from werkzeug.datastructures import FileStorage
+from model import db, new_id, CustomImage, OrderItem, Order, Product, UserRole, OrderStatus, ImageApprovalStatus
+from auth.decorators import require_user, require_admin
 import logging
-from sqlalchemy.exc import OperationalError, SQLAlchemyError
-from PIL import Image
-import base64
+import math
+from sqlalchemy import select, update, delete, func, cast, tuple_, String
+from sqlalchemy.exc import OperationalError, SQLAlchemyError, IntegrityError
 from io import BytesIO
+import time
+import secrets
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import cloudinary.uploader
+import cloudinary.api
+import cloudinary.utils
+from cloudinary_utils import cloudinary_call
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Configuration
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'bmp'}
+ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'bmp', 'webp'}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+DIRECT_UPLOAD_FOLDER = "custom_images/pending"
+MAX_BATCH_FILES = 20
+BATCH_UPLOAD_CONCURRENCY = 10
+MAX_PER_PAGE = 100
+CLOUDINARY_DELETE_BATCH_SIZE = 100
+MAX_BATCH_APPROVALS = 100
+RAW_UPLOAD_CHUNK_SIZE = 64 * 1024
+MAX_FORM_OVERHEAD = 64 * 1024  # multipart boundaries, headers and form fields
+MAX_CONTENT_LENGTH = MAX_FILE_SIZE + MAX_FORM_OVERHEAD  # app-wide request body limit
+MAX_BATCH_CONTENT_LENGTH = MAX_BATCH_FILES * MAX_FILE_SIZE + MAX_FORM_OVERHEAD
+BATCH_UPLOAD_ENDPOINT = 'customimagebatchresource'  # Flask-RESTful's default endpoint name
+UPLOAD_TIMEOUT = 60  # seconds a single Cloudinary upload may hold a request thread
+NOTIFICATION_MAX_AGE = 7200  # seconds a signed Cloudinary notification stays valid
+
+_upload_pool = ThreadPoolExecutor(max_workers=BATCH_UPLOAD_CONCURRENCY)
+
+_ALLOWED_SUFFIXES = tuple('.' + ext for ext in ALLOWED_EXTENSIONS)
+_STATUS_MAP = {status.value: status for status in ImageApprovalStatus}
 
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
+
+_IMAGE_SIGNATURES = (
+    b'\x89PNG\r\n\x1a\n',  # PNG
+    b'\xff\xd8\xff',         # JPEG
+    b'GIF87a',
+    b'GIF89a',
+    b'BM'                    # BMP
+)
+
+def _image_error(file):
+    """Check an upload's size and magic bytes before it is sent to Cloudinary.
+
+    Returns an error response tuple, or None when the file is acceptable.
+    """
+    stream = file.stream
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    if size > MAX_FILE_SIZE:
+        return {"message": "Image exceeds the maximum size of 5MB"}, 413
+
+    header = stream.read(12)
+    stream.seek(0)
+    is_webp = header[:4] == b'RIFF' and header[8:12] == b'WEBP'
+    if not (header.startswith(_IMAGE_SIGNATURES) or is_webp):
+        return {"message": "File content is not a supported image type"}, 400
+
+    return None
+
+def _unique_suffix():
+    """Suffix for Cloudinary public ids; unique even for uploads in the same second."""
+    return f"{time.time_ns()}_{secrets.token_hex(3)}"
+
+def _single_upload_too_large():
+    """Reject a single-image request from its Content-Length, before parsing the body."""
+    return (request.content_length or 0) > MAX_CONTENT_LENGTH
+
+def _is_raw_image_upload():
+    return request.mimetype.startswith('image/')
+
+def _read_raw_image(filename=None):
+    """Read a raw image/* request body in chunks, without the multipart parser.
+
+    Returns a FileStorage, or None as soon as the body exceeds MAX_FILE_SIZE.
+    """
+    buffer = BytesIO()
+    total = 0
+    while True:
+        chunk = request.stream.read(RAW_UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > MAX_FILE_SIZE:
+            return None
+        buffer.write(chunk)
+    buffer.seek(0)
+
+    filename = filename or f"image.{request.mimetype.split('/', 1)[1]}"
+    return FileStorage(stream=buffer, filename=filename, content_type=request.mimetype)
+
+def _owned_by(user_id):
+    """Filter custom images to those on the user's orders.
+
+    An IN subquery keeps the list queries on custom_images alone instead of
+    joining every order item and order row before sorting and paging.
+    """
+    return CustomImage.order_item_id.in_(
+        select(OrderItem.id).join(Order).where(Order.user_id == user_id)
+    )
+
+def _order_item_error(order_item_id, user_id, role):
+    """Check that the caller may attach a new custom image to an order item.
+
+    Returns an error response tuple, or None when the order item is usable.
+    """
+    # Ownership and the duplicate check in one round-trip.
+    has_image = select(CustomImage.id).where(CustomImage.order_item_id == OrderItem.id).exists()
+    query = db.session.query(OrderItem.id, has_image.label('has_image')).filter(OrderItem.id == order_item_id)
+    if role != UserRole.ADMIN:
+        query = query.join(Order).filter(Order.user_id == user_id)
+
+    order_item = query.first()
+    if not order_item:
+        return {"message": "Order item not found"}, 404
+
+    if order_item.has_image:
+        return {"message": "Custom image already exists for this order item"}, 400
+
+    return None
+
+def _canonical_ids(ids):
+    """Return the ids in canonical UUID form, or None if any is malformed.
+
+    Rows come back with lowercase hyphenated ids, so request ids must be in
+    the same form before they are compared with query results.
+    """
+    try:
+        return [str(uuid.UUID(str(item_id))) for item_id in ids]
+    except ValueError:
+        return None
+
+def _destroy_uploaded(public_ids):
+    """Remove Cloudinary assets uploaded for rows that were never inserted."""
+    try:
+        cloudinary_call(cloudinary.api.delete_resources, public_ids, resource_type="image")
+    except Exception as e:
+        logger.warning("Failed to delete orphaned uploads %s from Cloudinary: %s", public_ids, e)
+
+def _pagination_args():
+    """Read page, per_page and count from the query string, clamped to safe bounds."""
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', 10, type=int), 1), MAX_PER_PAGE)
+    with_count = request.args.get('count', 'true', type=str).lower() != 'false'
+    return page, per_page, with_count
+
+def _cursor_arg():
+    """Parse the optional ?before=<upload_date ISO>_<id> keyset cursor.
+
+    Returns (cursor, error); cursor is an (upload_date, id) tuple, or None
+    when the client pages by offset. Rows inserted in one transaction share
+    an upload_date, so the id breaks ties between them.
+    """
+    before = request.args.get('before', type=str)
+    if not before:
+        return None, None
+    upload_date, _, image_id = before.rpartition('_')
+    try:
+        return (datetime.fromisoformat(upload_date), str(uuid.UUID(image_id))), None
+    except ValueError:
+        return None, ({"message": "Invalid cursor. Use the next_cursor from the previous page"}, 400)
+
+def _next_cursor(upload_date, image_id):
+    return f"{upload_date.isoformat()}_{image_id}"
+
+# Keyset order for the image listings: the id gives a stable order among
+# rows that share an upload_date.
+_CURSOR_COLUMNS = tuple_(CustomImage.upload_date, CustomImage.id)
+
+async def _upload_batch(uploads):
+    """Upload (order_item_id, file) pairs to Cloudinary concurrently.
+
+    Returns one upload result or exception per pair, in input order.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(BATCH_UPLOAD_CONCURRENCY)
+
+    async def upload_one(order_item_id, file):
+        async with semaphore:
+            return await loop.run_in_executor(_upload_pool, functools.partial(
+                cloudinary_call,
+                cloudinary.uploader.upload,
+                file,
+                folder="custom_images/pending",
+                resource_type="auto",
+                public_id=f"pending_{order_item_id}_{_unique_suffix()}",
+                timeout=UPLOAD_TIMEOUT
+            ))
+
+    return await asyncio.gather(
+        *(upload_one(order_item_id, file) for order_item_id, file in uploads),
+        return_exceptions=True
+    )
 
 class TempImageResource(Resource):
-    @jwt_required()
+    @require_user
     def post(self):
         try:
-            current_user_id = get_jwt_identity()
-            user = User.query.get(current_user_id)
+            current_user_id = g.current_user_id
 
-            if not user:
-                return {"message": "User not found"}, 404
+            if _single_upload_too_large():
+                return {"message": "Image exceeds the maximum size of 5MB"}, 413
 
-            if not request.content_type or 'multipart/form-data' not in request.content_type:
-                return {"message": "Content-Type must be multipart/form-data"}, 400
+            if _is_raw_image_upload():
+                files = _read_raw_image(request.args.get('filename'))
+                if files is None:
+                    return {"message": "Image exceeds the maximum size of 5MB"}, 413
+            elif request.content_type and 'multipart/form-data' in request.content_type:
+                files = request.files.get('image')
+            else:
+                return {"message": "Content-Type must be multipart/form-data or an image type"}, 400
 
-            files = request.files.get('image')
             if not files or files.filename == '':
                 return {"message": "No image file provided"}, 400
 
             if not allowed_file(files.filename):
-                return {"message": "Invalid file type. Allowed types: PNG, JPG, JPEG, GIF, WEBP"}, 400
+                return {"message": "Invalid file type. Allowed types: PNG, JPG, JPEG, GIF, BMP, WEBP"}, 400
+
+            error = _image_error(files)
+            if error:
+                return error
 
             try:
-                upload_result = cloudinary.uploader.upload(
+                upload_result = cloudinary_call(
+                    cloudinary.uploader.upload,
                     files,
                     folder="custom_images/temp",
                     resource_type="auto",
-                    public_id=f"temp_{current_user_id}_{int(datetime.utcnow().timestamp())}"
+                    public_id=f"temp_{current_user_id}_{_unique_suffix()}",
+                    timeout=UPLOAD_TIMEOUT
                 )
                 image_url = upload_result.get('secure_url')
                 cloudinary_public_id = upload_result.get('public_id')
             except Exception as e:
-                logger.error(f"Error uploading image to Cloudinary: {str(e)}")
+                logger.error("Error uploading image to Cloudinary: %s", e)
                 return {"message": "Failed to upload image"}, 500
 
             custom_image = CustomImage(
@@ -69,25 +265,29 @@ class TempImageResource(Resource):
             )
 
             db.session.add(custom_image)
-            db.session.commit()
-
-            return {
+            # Flush to get the generated id and serialize before commit expires
+            # the instance, so the response does not re-SELECT the row.
+            db.session.flush()
+            response = {
                 "message": "Custom image uploaded successfully and pending approval",
                 "id": custom_image.id,
                 "image_url": custom_image.image_url,
                 "image_name": custom_image.image_name,
                 "approval_status": custom_image.approval_status.value
-            }, 201
+            }
+            db.session.commit()
+
+            return response, 201
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error uploading temp custom image: {str(e)}")
+            logger.error("Error uploading temp custom image: %s", e)
             return {"error": str(e)}, 500
 
-    @jwt_required()
+    @require_user
     def delete(self, image_id):
         try:
-            current_user_id = get_jwt_identity()
+            current_user_id = g.current_user_id
 
             temp_image = CustomImage.query.filter_by(
                 id=image_id,
@@ -100,9 +300,9 @@ class TempImageResource(Resource):
 
             if temp_image.cloudinary_public_id:
                 try:
-                    cloudinary.uploader.destroy(temp_image.cloudinary_public_id)
+                    cloudinary_call(cloudinary.uploader.destroy, temp_image.cloudinary_public_id)
                 except Exception as e:
-                    logger.warning(f"Failed to delete temp image from Cloudinary: {str(e)}")
+                    logger.warning("Failed to delete temp image from Cloudinary: %s", e)
 
             db.session.delete(temp_image)
             db.session.commit()
@@ -110,45 +310,44 @@ class TempImageResource(Resource):
             return {"message": "Temporary image deleted successfully"}, 200
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error deleting temporary image id {image_id}: {str(e)}")
+            logger.error("Error deleting temporary image id %s: %s", image_id, e)
             return {"error": "An unexpected error occurred during image deletion."}, 500
 
 class CustomImageResource(Resource):
-    @jwt_required()
+    @require_user
     def get(self, image_id=None):
-        current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-
-        if not user:
-            return {"message": "User not found"}, 404
+        current_user_id = g.current_user_id
+        role = g.current_role
 
         if image_id:
             try:
-                if user.role == UserRole.ADMIN:
-                    custom_image = CustomImage.query.get(image_id)
+                if role == UserRole.ADMIN:
+                    custom_image = db.session.get(CustomImage, image_id)
                 else:
-                    custom_image = CustomImage.query.join(OrderItem).join(Order).filter(
+                    custom_image = CustomImage.query.filter(
                         CustomImage.id == image_id,
-                        Order.user_id == current_user_id
+                        _owned_by(current_user_id)
                     ).first()
 
                 if custom_image:
                     return custom_image.as_dict(), 200
                 return {"message": "Custom image not found"}, 404
             except (OperationalError, SQLAlchemyError) as e:
-                logger.error(f"Database error: {str(e)}")
+                logger.error("Database error: %s", e)
                 return {"message": "Database connection error"}, 500
 
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 10, type=int)
+        page, per_page, with_count = _pagination_args()
+        before, error = _cursor_arg()
+        if error:
+            return error
         order_item_id = request.args.get('order_item_id', type=str)
         product_id = request.args.get('product_id', type=str)
 
         try:
-            if user.role == UserRole.ADMIN:
+            if role == UserRole.ADMIN:
                 query = CustomImage.query
             else:
-                query = CustomImage.query.join(OrderItem).join(Order).filter(Order.user_id == current_user_id)
+                query = CustomImage.query.filter(_owned_by(current_user_id))
 
             if order_item_id:
                 query = query.filter(CustomImage.order_item_id == order_item_id)
@@ -156,42 +355,57 @@ class CustomImageResource(Resource):
             if product_id:
                 query = query.filter(CustomImage.product_id == product_id)
 
-            query = query.order_by(CustomImage.upload_date.desc())
+            if before:
+                # Keyset paging: seek past the previous page instead of an OFFSET scan.
+                query = query.filter(_CURSOR_COLUMNS < before)
 
-            custom_images = query.paginate(page=page, per_page=per_page, error_out=False)
+            query = query.order_by(CustomImage.upload_date.desc(), CustomImage.id.desc())
 
-            if not custom_images.items:
-                return {
-                    'custom_images': [],
-                    'total': 0,
-                    'pages': 0,
-                    'current_page': page
-                }
+            if with_count and not before:
+                custom_images = query.paginate(page=page, per_page=per_page, error_out=False)
+                items = custom_images.items
+                total, pages, has_next = custom_images.total, custom_images.pages, custom_images.has_next
+            else:
+                # Skip the COUNT(*) query: fetch one extra row to learn whether a next page exists.
+                offset = 0 if before else (page - 1) * per_page
+                items = query.limit(per_page + 1).offset(offset).all()
+                has_next = len(items) > per_page
+                items = items[:per_page]
+                total = pages = None
 
             return {
-                'custom_images': [img.as_dict() for img in custom_images.items],
-                'total': custom_images.total,
-                'pages': custom_images.pages,
-                'current_page': custom_images.page
+                'custom_images': [img.as_dict() for img in items],
+                'total': total,
+                'pages': pages,
+                'current_page': page,
+                'has_next': has_next,
+                'next_cursor': _next_cursor(items[-1].upload_date, items[-1].id) if has_next else None
             }, 200
 
         except (OperationalError, SQLAlchemyError) as e:
-            logger.error(f"Database error: {str(e)}")
+            logger.error("Database error: %s", e)
             return {"message": "Database connection error"}, 500
         except Exception as e:
-            logger.error(f"Error fetching custom images: {str(e)}")
+            logger.error("Error fetching custom images: %s", e)
             return {"message": "Error fetching custom images"}, 500
 
-    @jwt_required()
+    @require_user
     def post(self):
         try:
-            current_user_id = get_jwt_identity()
-            user = User.query.get(current_user_id)
+            current_user_id = g.current_user_id
+            role = g.current_role
+
+            if _single_upload_too_large():
+                return {"message": "Image exceeds the maximum size of 5MB"}, 413
 
-            if not user:
-                return {"message": "User not found"}, 404
+            is_raw = _is_raw_image_upload()
+            is_multipart = bool(request.content_type and 'multipart/form-data' in request.content_type)
 
-            if request.content_type and 'multipart/form-data' in request.content_type:
+            if is_raw:
+                # Raw image body: metadata travels in the query string and the
+                # body is read after validation, without the form parser.
+                data = request.args.to_dict()
+            elif is_multipart:
                 data = request.form.to_dict()
                 files = request.files.get('image')
 
@@ -200,81 +414,127 @@ class CustomImageResource(Resource):
 
                 if files.filename == '':
                     return {"message": "No file selected"}, 400
+            else:
+                # Direct upload: the browser already posted the file to Cloudinary
+                # with a signature from /custom-images/sign; only metadata is sent here.
+                data = request.get_json(silent=True)
+                if not data:
+                    return {"message": "No data provided"}, 400
 
-                if 'order_item_id' not in data:
-                    return {"message": "Missing field: order_item_id"}, 400
+                for field in ('public_id', 'version', 'signature'):
+                    if field not in data:
+                        return {"message": f"Missing field: {field}"}, 400
 
-                order_item_id = data['order_item_id']
+            if 'order_item_id' not in data:
+                return {"message": "Missing field: order_item_id"}, 400
 
-                if user.role == UserRole.ADMIN:
-                    order_item = OrderItem.query.get(order_item_id)
-                else:
-                    order_item = OrderItem.query.join(Order).filter(
-                        OrderItem.id == order_item_id,
-                        Order.user_id == current_user_id
-                    ).first()
+            order_item_id = data['order_item_id']
 
-                if not order_item:
-                    return {"message": "Order item not found"}, 404
+            error = _order_item_error(order_item_id, current_user_id, role)
+            if error:
+                return error
 
-                existing_image = CustomImage.query.filter_by(order_item_id=order_item_id).first()
-                if existing_image:
-                    return {"message": "Custom image already exists for this order item"}, 400
+            if is_raw or is_multipart:
+                if is_raw:
+                    files = _read_raw_image(data.get('filename'))
+                    if files is None:
+                        return {"message": "Image exceeds the maximum size of 5MB"}, 413
 
                 if not allowed_file(files.filename):
-                    return {"message": "Invalid file type. Allowed types: PNG, JPG, JPEG, GIF, WEBP"}, 400
+                    return {"message": "Invalid file type. Allowed types: PNG, JPG, JPEG, GIF, BMP, WEBP"}, 400
+
+                error = _image_error(files)
+                if error:
+                    return error
+
+                # End the read transaction so no pooled connection is held while
+                # uploading. A concurrent upload for the same item is caught by
+                # the unique constraint at insert time.
+                db.session.rollback()
 
                 try:
-                    upload_result = cloudinary.uploader.upload(
+                    upload_result = cloudinary_call(
+                        cloudinary.uploader.upload,
                         files,
                         folder="custom_images/pending",
                         resource_type="auto",
-                        public_id=f"pending_{order_item_id}_{int(datetime.utcnow().timestamp())}"
+                        public_id=f"pending_{order_item_id}_{_unique_suffix()}",
+                        timeout=UPLOAD_TIMEOUT
                     )
-                    image_url = upload_result.get('secure_url')
-                    cloudinary_public_id = upload_result.get('public_id')
                 except Exception as e:
-                    logger.error(f"Error uploading image to Cloudinary: {str(e)}")
+                    logger.error("Error uploading image to Cloudinary: %s", e)
                     return {"message": "Failed to upload image"}, 500
 
                 custom_image = CustomImage(
                     order_item_id=order_item_id,
-                    image_url=image_url,
+                    user_id=current_user_id,
+                    image_url=upload_result.get('secure_url'),
                     image_name=files.filename,
-                    cloudinary_public_id=cloudinary_public_id,
+                    cloudinary_public_id=upload_result.get('public_id'),
                     approval_status=ImageApprovalStatus.PENDING
                 )
+                db.session.add(custom_image)
+            else:
+                cloudinary_public_id = data['public_id']
+
+                if not cloudinary_public_id.startswith(f"{DIRECT_UPLOAD_FOLDER}/"):
+                    return {"message": "Image was not uploaded to the pending folder"}, 400
+
+                if not cloudinary.utils.verify_api_response_signature(
+                    cloudinary_public_id, data['version'], data['signature']
+                ):
+                    return {"message": "Invalid upload signature"}, 400
 
+                if CustomImage.query.filter_by(cloudinary_public_id=cloudinary_public_id).first():
+                    return {"message": "Image has already been registered"}, 400
+
+                custom_image = CustomImage(
+                    order_item_id=order_item_id,
+                    user_id=current_user_id,
+                    image_url=cloudinary.CloudinaryImage(cloudinary_public_id).build_url(
+                        secure=True, version=data['version']
+                    ),
+                    image_name=data.get('image_name'),
+                    cloudinary_public_id=cloudinary_public_id,
+                    approval_status=ImageApprovalStatus.PENDING
+                )
                 db.session.add(custom_image)
-                db.session.commit()
 
-                return {
-                    "message": "Custom image uploaded successfully and pending approval",
-                    "custom_image": custom_image.as_dict(),
-                    "id": custom_image.id
-                }, 201
+            uploaded_public_id = custom_image.cloudinary_public_id if is_raw or is_multipart else None
+            try:
+                db.session.flush()
+            except IntegrityError:
+                db.session.rollback()
+                if uploaded_public_id:
+                    _destroy_uploaded([uploaded_public_id])
+                return {"message": "Custom image already exists for this order item"}, 409
+            custom_image_dict = custom_image.as_dict()
+            db.session.commit()
+
+            return {
+                "message": "Custom image uploaded successfully and pending approval",
+                "custom_image": custom_image_dict,
+                "id": custom_image_dict["id"]
+            }, 201
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error uploading custom image: {str(e)}")
+            logger.error("Error uploading custom image: %s", e)
             return {"error": str(e)}, 500
-    @jwt_required()
+    @require_user
     def put(self, image_id):
         """Update the order_item_id for a custom image."""
         try:
-            current_user_id = get_jwt_identity()
-            user = User.query.get(current_user_id)
-            
-            if not user:
-                return {"message": "User not found"}, 404
+            current_user_id = g.current_user_id
+            role = g.current_role
 
             # Find the existing custom image
-            if user.role == UserRole.ADMIN:
-                custom_image = CustomImage.query.get(image_id)
+            if role == UserRole.ADMIN:
+                custom_image = db.session.get(CustomImage, image_id)
             else:
-                custom_image = CustomImage.query.join(OrderItem).join(Order).filter(
+                custom_image = CustomImage.query.filter(
                     CustomImage.id == image_id,
-                    Order.user_id == current_user_id
+                    _owned_by(current_user_id)
                 ).first()
 
             if not custom_image:
@@ -292,8 +552,8 @@ class CustomImageResource(Resource):
             new_order_item_id = data['order_item_id']
 
             # Validate new order item exists and belongs to user
-            if user.role == UserRole.ADMIN:
-                new_order_item = OrderItem.query.get(new_order_item_id)
+            if role == UserRole.ADMIN:
+                new_order_item = db.session.get(OrderItem, new_order_item_id)
             else:
                 new_order_item = OrderItem.query.join(Order).filter(
                     OrderItem.id == new_order_item_id,
@@ -312,56 +572,62 @@ class CustomImageResource(Resource):
             if existing_image:
                 return {"message": "Custom image already exists for the target order item"}, 400
 
-            # Update the order_item_id
+            # Update the order_item_id. Flush before renaming in Cloudinary so a
+            # concurrent image for the same item fails on the unique constraint
+            # without leaving the asset renamed.
             custom_image.order_item_id = new_order_item_id
             custom_image.updated_at = datetime.utcnow()  # Assuming you have this field
+            try:
+                db.session.flush()
+            except IntegrityError:
+                db.session.rollback()
+                return {"message": "Custom image already exists for the target order item"}, 400
 
             try:
                 old_public_id = custom_image.cloudinary_public_id
                 # Create new public_id with new order_item_id
                 if 'pending_' in old_public_id:
-                    new_public_id = f"pending_{new_order_item_id}_{int(datetime.utcnow().timestamp())}"
+                    new_public_id = f"pending_{new_order_item_id}_{_unique_suffix()}"
                 elif 'approved_' in old_public_id:
-                    new_public_id = f"approved_{new_order_item_id}_{int(datetime.utcnow().timestamp())}"
+                    new_public_id = f"approved_{new_order_item_id}_{_unique_suffix()}"
                 else:
-                    new_public_id = f"{new_order_item_id}_{int(datetime.utcnow().timestamp())}"
+                    new_public_id = f"{new_order_item_id}_{_unique_suffix()}"
                 
                 # Rename the image in Cloudinary
-                rename_result = cloudinary.uploader.rename(old_public_id, new_public_id)
+                rename_result = cloudinary_call(cloudinary.uploader.rename, old_public_id, new_public_id)
                 custom_image.cloudinary_public_id = new_public_id
                 custom_image.image_url = rename_result.get('secure_url')
                 
             except Exception as e:
-                logger.warning(f"Failed to rename image in Cloudinary: {str(e)}")
+                logger.warning("Failed to rename image in Cloudinary: %s", e)
                 # Continue with database update even if Cloudinary rename fails
 
+            db.session.flush()
+            custom_image_dict = custom_image.as_dict()
             db.session.commit()
 
             return {
                 "message": "Custom image order item updated successfully",
-                "custom_image": custom_image.as_dict(),
-                "id": custom_image.id
+                "custom_image": custom_image_dict,
+                "id": custom_image_dict["id"]
             }, 200
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error updating custom image order item: {str(e)}")
+            logger.error("Error updating custom image order item: %s", e)
             return {"error": str(e)}, 500
-    @jwt_required()
+    @require_user
     def delete(self, image_id):
         try:
-            current_user_id = get_jwt_identity()
-            user = User.query.get(current_user_id)
-
-            if not user:
-                return {"message": "User not found"}, 404
+            current_user_id = g.current_user_id
+            role = g.current_role
 
-            if user.role == UserRole.ADMIN:
-                custom_image = CustomImage.query.get(image_id)
+            if role == UserRole.ADMIN:
+                custom_image = db.session.get(CustomImage, image_id)
             else:
-                custom_image = CustomImage.query.join(OrderItem).join(Order).filter(
+                custom_image = CustomImage.query.filter(
                     CustomImage.id == image_id,
-                    Order.user_id == current_user_id
+                    _owned_by(current_user_id)
                 ).first()
 
             if not custom_image:
@@ -369,9 +635,9 @@ class CustomImageResource(Resource):
 
             if custom_image.cloudinary_public_id:
                 try:
-                    cloudinary.uploader.destroy(custom_image.cloudinary_public_id)
+                    cloudinary_call(cloudinary.uploader.destroy, custom_image.cloudinary_public_id)
                 except Exception as e:
-                    logger.warning(f"Failed to delete image from Cloudinary: {str(e)}")
+                    logger.warning("Failed to delete image from Cloudinary: %s", e)
 
             db.session.delete(custom_image)
             db.session.commit()
@@ -379,20 +645,210 @@ class CustomImageResource(Resource):
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error deleting custom image id {image_id}: {str(e)}")
+            logger.error("Error deleting custom image id %s: %s", image_id, e)
             return {"error": "An unexpected error occurred during image deletion."}, 500
 
+class CustomImageBatchResource(Resource):
+    @require_user
+    def post(self):
+        """Upload several custom images at once, one per order item."""
+        try:
+            current_user_id = g.current_user_id
+            role = g.current_role
+
+            if not request.content_type or 'multipart/form-data' not in request.content_type:
+                return {"message": "Content-Type must be multipart/form-data"}, 400
+
+            files = request.files.getlist('images')
+            order_item_ids = request.form.getlist('order_item_id')
+
+            if not files:
+                return {"message": "No image files provided"}, 400
+
+            if len(files) > MAX_BATCH_FILES:
+                return {"message": f"Too many images. Maximum per batch: {MAX_BATCH_FILES}"}, 400
+
+            if len(order_item_ids) != len(files):
+                return {"message": "Provide one order_item_id per image"}, 400
+
+            order_item_ids = _canonical_ids(order_item_ids)
+            if order_item_ids is None:
+                return {"message": "Invalid order_item_id"}, 400
+
+            if len(set(order_item_ids)) != len(order_item_ids):
+                return {"message": "Duplicate order_item_id in batch"}, 400
+
+            for file in files:
+                if not file.filename or not allowed_file(file.filename):
+                    return {"message": "Invalid file type. Allowed types: PNG, JPG, JPEG, GIF, BMP, WEBP"}, 400
+
+                error = _image_error(file)
+                if error:
+                    return error
+
+            query = db.session.query(OrderItem.id).filter(OrderItem.id.in_(order_item_ids))
+            if role != UserRole.ADMIN:
+                query = query.join(Order).filter(Order.user_id == current_user_id)
+
+            found_ids = {row.id for row in query.all()}
+            missing_ids = [item_id for item_id in order_item_ids if item_id not in found_ids]
+            if missing_ids:
+                return {"message": "Order item not found", "order_item_ids": missing_ids}, 404
+
+            existing_ids = [row.order_item_id for row in db.session.query(CustomImage.order_item_id).filter(
+                CustomImage.order_item_id.in_(order_item_ids)
+            ).all()]
+            if existing_ids:
+                return {
+                    "message": "Custom image already exists for this order item",
+                    "order_item_ids": existing_ids
+                }, 400
+
+            # End the read transaction so no pooled connection is held while
+            # uploading; concurrent duplicates are caught by the unique
+            # constraint at insert time.
+            db.session.rollback()
+
+            uploads = list(zip(order_item_ids, files))
+            results = asyncio.run(_upload_batch(uploads))
+
+            rows = []
+            failed = []
+            for (order_item_id, file), result in zip(uploads, results):
+                if isinstance(result, Exception):
+                    logger.error("Error uploading image to Cloudinary: %s", result)
+                    failed.append({"order_item_id": order_item_id, "image_name": file.filename})
+                    continue
+
+                rows.append({
+                    "id": new_id(),
+                    "order_item_id": order_item_id,
+                    "user_id": current_user_id,
+                    "image_url": result.get('secure_url'),
+                    "image_name": file.filename,
+                    "cloudinary_public_id": result.get('public_id'),
+                    "approval_status": ImageApprovalStatus.PENDING
+                })
+
+            if not rows:
+                return {"message": "Failed to upload images", "failed": failed}, 500
+
+            # One multi-row INSERT and a single commit for the whole batch.
+            try:
+                db.session.bulk_insert_mappings(CustomImage, rows)
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                _destroy_uploaded([row["cloudinary_public_id"] for row in rows])
+                return {"message": "Custom image already exists for this order item"}, 409
+
+            return {
+                "message": "Custom images uploaded successfully and pending approval",
+                "custom_images": [{
+                    "id": row["id"],
+                    "order_item_id": row["order_item_id"],
+                    "image_url": row["image_url"],
+                    "image_name": row["image_name"],
+                    "approval_status": row["approval_status"].value
+                } for row in rows],
+                "failed": failed
+            }, 201
+
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error uploading custom image batch: %s", e)
+            return {"error": str(e)}, 500
+
+class CustomImageUploadSignatureResource(Resource):
+    @require_user
+    def post(self):
+        """Sign a direct browser-to-Cloudinary upload into the pending folder.
+
+        With an order_item_id, the signature also covers the upload context and
+        a notification_url, so Cloudinary registers the image through
+        /custom-images/callback without a second request from the browser.
+        """
+        config = cloudinary.config()
+        params_to_sign = {
+            "timestamp": int(time.time()),
+            "folder": DIRECT_UPLOAD_FOLDER
+        }
+
+        data = request.get_json(silent=True) or {}
+        order_item_id = data.get('order_item_id')
+        if order_item_id:
+            error = _order_item_error(order_item_id, g.current_user_id, g.current_role)
+            if error:
+                return error
+
+            params_to_sign["context"] = f"order_item_id={order_item_id}|user_id={g.current_user_id}"
+            params_to_sign["notification_url"] = url_for('customimageuploadcallbackresource', _external=True)
+
+        return {
+            **params_to_sign,
+            "signature": cloudinary.utils.api_sign_request(params_to_sign, config.api_secret),
+            "api_key": config.api_key,
+            "cloud_name": config.cloud_name
+        }, 200
+
+class CustomImageUploadCallbackResource(Resource):
+    def post(self):
+        """Register a signed direct upload from Cloudinary's upload notification."""
+        timestamp = request.headers.get('X-Cld-Timestamp', type=int)
+        signature = request.headers.get('X-Cld-Signature')
+        if not timestamp or not signature or not cloudinary.utils.verify_notification_signature(
+            request.get_data(as_text=True), timestamp, signature, valid_for=NOTIFICATION_MAX_AGE
+        ):
+            return {"message": "Invalid notification signature"}, 401
+
+        data = request.get_json(silent=True) or {}
+        context = (data.get('context') or {}).get('custom') or {}
+        order_item_id = context.get('order_item_id')
+        user_id = context.get('user_id')
+        public_id = data.get('public_id') or ''
+
+        # Other notifications, and uploads signed without an order item, are
+        # acknowledged so Cloudinary does not retry them.
+        if data.get('notification_type') != 'upload' or not order_item_id or not user_id \
+                or not public_id.startswith(f"{DIRECT_UPLOAD_FOLDER}/"):
+            return {"message": "Notification ignored"}, 200
+
+        try:
+            already_registered = CustomImage.query.filter(
+                (CustomImage.cloudinary_public_id == public_id) | (CustomImage.order_item_id == order_item_id)
+            ).first()
+            if already_registered:
+                return {"message": "Image has already been registered"}, 200
+
+            custom_image = CustomImage(
+                order_item_id=order_item_id,
+                user_id=user_id,
+                image_url=data.get('secure_url'),
+                image_name=data.get('original_filename'),
+                cloudinary_public_id=public_id,
+                approval_status=ImageApprovalStatus.PENDING
+            )
+            db.session.add(custom_image)
+            try:
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                return {"message": "Image has already been registered"}, 200
+
+            return {"message": "Custom image registered and pending approval"}, 201
+
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error registering uploaded custom image %s: %s", public_id, e)
+            return {"message": "Failed to register image"}, 500
+
 class CustomImageApprovalResource(Resource):
-    @jwt_required()
+    @require_admin
     def put(self, image_id):
         try:
-            current_user_id = get_jwt_identity()
-            user = User.query.get(current_user_id)
+            current_user_id = g.current_user_id
 
-            if not user or user.role != UserRole.ADMIN:
-                return {"message": "Only admins can approve/reject custom images"}, 403
-
-            custom_image = CustomImage.query.get(image_id)
+            custom_image = db.session.get(CustomImage, image_id)
             if not custom_image:
                 return {"error": "Custom image not found"}, 404
 
@@ -403,23 +859,8 @@ class CustomImageApprovalResource(Resource):
             action = data.get('action')
 
             if action == 'approve':
-                if custom_image.cloudinary_public_id:
-                    try:
-                        new_public_id = custom_image.cloudinary_public_id.replace('pending_', 'approved_')
-                        new_public_id = new_public_id.replace('custom_images/pending/', 'custom_images/approved/')
-
-                        cloudinary.uploader.rename(
-                            custom_image.cloudinary_public_id,
-                            f"custom_images/approved/{new_public_id}"
-                        )
-
-                        custom_image.cloudinary_public_id = f"custom_images/approved/{new_public_id}"
-                        custom_image.image_url = cloudinary.CloudinaryImage(f"custom_images/approved/{new_public_id}").build_url()
-
-                    except Exception as e:
-                        logger.error(f"Error moving image to approved folder: {str(e)}")
-                        return {"error": "Failed to move image to approved folder"}, 500
-
+                # Approval is tracked in the database only: the image keeps its
+                # public id and URL, so no Cloudinary call is needed.
                 custom_image.approval_status = ImageApprovalStatus.APPROVED
                 custom_image.approved_by = current_user_id
                 custom_image.approval_date = datetime.utcnow()
@@ -427,7 +868,7 @@ class CustomImageApprovalResource(Resource):
                 if "product_id" in data:
                     product_id = data["product_id"]
                     if product_id:
-                        product = Product.query.get(product_id)
+                        product = db.session.get(Product, product_id)
                         if not product:
                             return {"error": "Product not found"}, 400
                         custom_image.product_id = product_id
@@ -437,9 +878,9 @@ class CustomImageApprovalResource(Resource):
             elif action == 'reject':
                 if custom_image.cloudinary_public_id:
                     try:
-                        cloudinary.uploader.destroy(custom_image.cloudinary_public_id)
+                        cloudinary_call(cloudinary.uploader.destroy, custom_image.cloudinary_public_id)
                     except Exception as e:
-                        logger.warning(f"Failed to delete rejected image from Cloudinary: {str(e)}")
+                        logger.warning("Failed to delete rejected image from Cloudinary: %s", e)
 
                 custom_image.approval_status = ImageApprovalStatus.REJECTED
                 custom_image.approved_by = current_user_id
@@ -451,84 +892,226 @@ class CustomImageApprovalResource(Resource):
             else:
                 return {"error": "Invalid action. Use 'approve' or 'reject'"}, 400
 
+            db.session.flush()
+            custom_image_dict = custom_image.as_dict()
             db.session.commit()
 
             return {
                 "message": message,
-                "custom_image": custom_image.as_dict()
+                "custom_image": custom_image_dict
             }, 200
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error processing custom image approval: {str(e)}")
+            logger.error("Error processing custom image approval: %s", e)
             return {"error": f"An error occurred: {str(e)}"}, 500
 
-class AdminCustomImagesResource(Resource):
-    @jwt_required()
-    def get(self):
+class CustomImageApprovalBatchResource(Resource):
+    @require_admin
+    def post(self):
+        """Approve or reject several custom images in one request."""
         try:
-            current_user_id = get_jwt_identity()
-            user = User.query.get(current_user_id)
+            current_user_id = g.current_user_id
 
-            if not user or user.role != UserRole.ADMIN:
-                return {"message": "Only admins can access this endpoint"}, 403
+            data = request.get_json(silent=True)
+            if not data:
+                return {"error": "No data provided"}, 400
+
+            image_ids = data.get('image_ids') or []
+            action = data.get('action')
 
-            page = request.args.get('page', 1, type=int)
-            per_page = request.args.get('per_page', 10, type=int)
+            if action not in ('approve', 'reject'):
+                return {"error": "Invalid action. Use 'approve' or 'reject'"}, 400
+
+            if not image_ids:
+                return {"error": "No image_ids provided"}, 400
+
+            if len(image_ids) > MAX_BATCH_APPROVALS:
+                return {"error": f"Too many images. Maximum per batch: {MAX_BATCH_APPROVALS}"}, 400
+
+            image_ids = _canonical_ids(image_ids)
+            if image_ids is None:
+                return {"error": "Invalid image id"}, 400
+
+            images = db.session.execute(
+                select(CustomImage.id, CustomImage.cloudinary_public_id).where(CustomImage.id.in_(image_ids))
+            ).all()
+
+            found_ids = {image.id for image in images}
+            missing_ids = [image_id for image_id in image_ids if image_id not in found_ids]
+            if missing_ids:
+                return {"error": "Custom image not found", "image_ids": missing_ids}, 404
+
+            if action == 'approve':
+                values = {"approval_status": ImageApprovalStatus.APPROVED}
+            else:
+                public_ids = [image.cloudinary_public_id for image in images if image.cloudinary_public_id]
+                futures = [
+                    _upload_pool.submit(
+                        cloudinary_call,
+                        cloudinary.api.delete_resources,
+                        public_ids[i:i + CLOUDINARY_DELETE_BATCH_SIZE],
+                        resource_type="image"
+                    )
+                    for i in range(0, len(public_ids), CLOUDINARY_DELETE_BATCH_SIZE)
+                ]
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.warning("Failed to delete rejected images from Cloudinary: %s", e)
+
+                values = {
+                    "approval_status": ImageApprovalStatus.REJECTED,
+                    "rejection_reason": data.get('rejection_reason', 'No reason provided')
+                }
+
+            updated_ids = list(found_ids)
+            db.session.execute(
+                update(CustomImage).where(CustomImage.id.in_(updated_ids)).values(
+                    approved_by=current_user_id,
+                    approval_date=datetime.utcnow(),
+                    **values
+                ),
+                execution_options={"synchronize_session": False}
+            )
+
+            db.session.commit()
+
+            return {
+                "message": f"{len(updated_ids)} custom images {action}d",
+                "image_ids": updated_ids
+            }, 200
+
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error processing custom image batch approval: %s", e)
+            return {"error": "An error occurred while processing the batch"}, 500
+
+# Enum columns store the member name; the admin listing projects the name
+# as text and maps it to the API value without building Enum members.
+_APPROVAL_STATUS_BY_NAME = {m.name: m.value for m in ImageApprovalStatus}
+_ORDER_STATUS_BY_NAME = {m.name: m.value for m in OrderStatus}
+
+def _admin_image_dict(row):
+    """Serialize an admin listing row with the order and product details admins review."""
+    image_dict = {
+        "id": row["id"],
+        "order_item_id": row["order_item_id"],
+        "product_id": row["product_id"],
+        "user_id": row["user_id"],
+        "image_url": row["image_url"],
+        "image_name": row["image_name"],
+        "upload_date": row["upload_date"],
+        "is_temporary": row["is_temporary"],
+        "approval_status": _APPROVAL_STATUS_BY_NAME[row["approval_status"]],
+        "approved_by": row["approved_by"],
+        "approval_date": row["approval_date"],
+        "rejection_reason": row["rejection_reason"]
+    }
+
+    if row["order_id"]:
+        image_dict['order_info'] = {
+            'order_number': row["order_number"],
+            'customer_name': row["customer_name"],
+            'order_status': _ORDER_STATUS_BY_NAME[row["order_status"]]
+        }
+        image_dict['order_item_info'] = {
+            'quantity': row["quantity"],
+            'unit_price': float(row["unit_price"])
+        }
+
+    if row["product_row_id"]:
+        image_dict['product_info'] = {
+            'name': row["product_name"],
+            'description': row["product_description"],
+            'price': float(row["product_price"])
+        }
+
+    return image_dict
+
+# Built once at import: only the columns the admin listing needs, in a single
+# query instead of loading the order item, order and product per row. Requests
+# only add filters and paging on top.
+_ADMIN_IMAGES_SELECT = select(
+    CustomImage.id,
+    CustomImage.order_item_id,
+    CustomImage.product_id,
+    CustomImage.user_id,
+    CustomImage.image_url,
+    CustomImage.image_name,
+    CustomImage.upload_date,
+    CustomImage.is_temporary,
+    cast(CustomImage.approval_status, String).label('approval_status'),
+    CustomImage.approved_by,
+    CustomImage.approval_date,
+    CustomImage.rejection_reason,
+    Order.id.label('order_id'),
+    Order.order_number,
+    Order.customer_name,
+    cast(Order.status, String).label('order_status'),
+    OrderItem.quantity,
+    OrderItem.unit_price,
+    Product.id.label('product_row_id'),
+    Product.name.label('product_name'),
+    Product.description.label('product_description'),
+    Product.price.label('product_price')
+).select_from(CustomImage).outerjoin(
+    OrderItem, CustomImage.order_item_id == OrderItem.id
+).outerjoin(
+    Order, OrderItem.order_id == Order.id
+).outerjoin(
+    Product, CustomImage.product_id == Product.id
+).order_by(
+    CustomImage.upload_date.desc(), CustomImage.id.desc()
+)
+
+_ADMIN_COUNT_SELECT = select(func.count(CustomImage.id))
+
+class AdminCustomImagesResource(Resource):
+    @require_admin
+    def get(self):
+        try:
+            page, per_page, with_count = _pagination_args()
+            before, error = _cursor_arg()
+            if error:
+                return error
             status = request.args.get('status', type=str)
 
-            query = CustomImage.query
+            filters = []
 
             if status:
-                try:
-                    status_enum = ImageApprovalStatus(status.lower())
-                    query = query.filter(CustomImage.approval_status == status_enum)
-                except ValueError:
+                status_enum = _STATUS_MAP.get(status.lower())
+                if status_enum is None:
                     return {"error": "Invalid status. Use: pending, approved, rejected"}, 400
+                filters.append(CustomImage.approval_status == status_enum)
 
-            custom_images = query.order_by(CustomImage.upload_date.desc()).paginate(
-                page=page, per_page=per_page, error_out=False
-            )
+            stmt = _ADMIN_IMAGES_SELECT.where(*filters).limit(per_page + 1)
+            if before:
+                stmt = stmt.where(_CURSOR_COLUMNS < before)
+            else:
+                stmt = stmt.offset((page - 1) * per_page)
+
+            rows = db.session.execute(stmt).mappings().all()
+            has_next = len(rows) > per_page
+            rows = rows[:per_page]
 
-            image_data = []
-            for custom_image in custom_images.items:
-                image_dict = custom_image.as_dict()
-
-                if custom_image.order_item_id:
-                    order_item = OrderItem.query.get(custom_image.order_item_id)
-                    if order_item:
-                        order = Order.query.get(order_item.order_id)
-                        if order:
-                            image_dict['order_info'] = {
-                                'order_number': order.order_number,
-                                'customer_name': order.customer_name,
-                                'order_status': order.status.value
-                            }
-                            image_dict['order_item_info'] = {
-                                'quantity': order_item.quantity,
-                                'unit_price': float(order_item.unit_price)
-                            }
-
-                if custom_image.product_id:
-                    product = Product.query.get(custom_image.product_id)
-                    if product:
-                        image_dict['product_info'] = {
-                            'name': product.name,
-                            'description': product.description,
-                            'price': float(product.price)
-                        }
-
-                image_data.append(image_dict)
+            total = pages = None
+            if with_count and not before:
+                total = db.session.execute(_ADMIN_COUNT_SELECT.where(*filters)).scalar()
+                pages = math.ceil(total / per_page)
 
             return {
-                'custom_images': image_data,
-                'total': custom_images.total,
-                'pages': custom_images.pages,
-                'current_page': custom_images.page
+                'custom_images': [_admin_image_dict(row) for row in rows],
+                'total': total,
+                'pages': pages,
+                'current_page': page,
+                'has_next': has_next,
+                'next_cursor': _next_cursor(rows[-1]["upload_date"], rows[-1]["id"]) if has_next else None
             }, 200
 
         except Exception as e:
-            logger.error(f"Error fetching admin custom images: {str(e)}")
+            logger.error("Error fetching admin custom images: %s", e)
             return {"message": "Error fetching custom images"}, 500
 
 def cleanup_abandoned_pending_images():
@@ -537,29 +1120,52 @@ def cleanup_abandoned_pending_images():
 
         cutoff_date = datetime.utcnow() - timedelta(days=7)
 
-        abandoned_images = CustomImage.query.filter(
-            CustomImage.approval_status == ImageApprovalStatus.PENDING,
-            CustomImage.upload_date < cutoff_date
+        abandoned_images = db.session.execute(
+            select(CustomImage.id, CustomImage.cloudinary_public_id).where(
+                CustomImage.approval_status == ImageApprovalStatus.PENDING,
+                CustomImage.upload_date < cutoff_date
+            )
         ).all()
 
-        for image in abandoned_images:
-            if image.cloudinary_public_id:
-                try:
-                    cloudinary.uploader.destroy(image.cloudinary_public_id)
-                except Exception as e:
-                    logger.warning(f"Failed to delete abandoned image from Cloudinary: {str(e)}")
-
-            db.session.delete(image)
+        if not abandoned_images:
+            logger.info("Cleaned up 0 abandoned pending images")
+            return
+
+        # Cloudinary deletes up to 100 resources per Admin API call; run the
+        # batches concurrently, bounded by the shared Cloudinary throttle.
+        public_ids = [image.cloudinary_public_id for image in abandoned_images if image.cloudinary_public_id]
+        futures = [
+            _upload_pool.submit(
+                cloudinary_call,
+                cloudinary.api.delete_resources,
+                public_ids[i:i + CLOUDINARY_DELETE_BATCH_SIZE],
+                resource_type="image"
+            )
+            for i in range(0, len(public_ids), CLOUDINARY_DELETE_BATCH_SIZE)
+        ]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning("Failed to delete abandoned images from Cloudinary: %s", e)
 
+        db.session.execute(
+            delete(CustomImage).where(CustomImage.id.in_([image.id for image in abandoned_images])),
+            execution_options={"synchronize_session": False}
+        )
         db.session.commit()
-        logger.info(f"Cleaned up {len(abandoned_images)} abandoned pending images")
+        logger.info("Cleaned up %s abandoned pending images", len(abandoned_images))
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error cleaning up abandoned images: {str(e)}")
+        logger.error("Error cleaning up abandoned images: %s", e)
 
 def register_custom_image_resources(api):
     api.add_resource(CustomImageResource, "/custom-images", "/custom-images/<string:image_id>")
+    api.add_resource(CustomImageBatchResource, "/custom-images/batch")
+    api.add_resource(CustomImageUploadSignatureResource, "/custom-images/sign")
+    api.add_resource(CustomImageUploadCallbackResource, "/custom-images/callback")
     api.add_resource(CustomImageApprovalResource, "/custom-images/<string:image_id>/approve")
+    api.add_resource(CustomImageApprovalBatchResource, "/custom-images/approve-batch")
     api.add_resource(AdminCustomImagesResource, "/admin/custom-images")
     api.add_resource(TempImageResource, "/temp-images", "/temp-images/<string:image_id>")
@@ -16,8 +16,6 @@ from config import Config
 # Initialize Mail (but attach it to the Flask app later)
 mail = Mail()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class EmailError(Exception):
@@ -83,7 +81,7 @@ class AttachmentHandler:
         try:
             is_valid, error_msg = AttachmentHandler.validate_attachment(file_path)
             if not is_valid:
-                logger.warning(f"Skipping attachment: {error_msg}")
+                logger.warning("Skipping attachment: %s", error_msg)
                 return False
             
             mime_type = AttachmentHandler.get_mime_type(file_path)
@@ -97,11 +95,11 @@ class AttachmentHandler:
                 )
             
             file_size = os.path.getsize(file_path)
-            logger.info(f"Attached file {display_name} ({file_size / 1024:.1f}KB)")
+            logger.info("Attached file %s (%.1fKB)", display_name, file_size / 1024)
             return True
             
         except Exception as e:
-            logger.error(f"Error attaching file {file_path}: {e}")
+            logger.error("Error attaching file %s: %s", file_path, e)
             return False
 
 class EmailTemplateEngine:
@@ -182,7 +180,7 @@ class EmailService:
                 msg.body = body
             
             mail.send(msg)
-            logger.info(f"Email sent successfully to {', '.join(recipients)}")
+            logger.info("Email sent successfully to %s", ', '.join(recipients))
             return True
             
         except Exception as e:
@@ -223,7 +221,7 @@ class EmailService:
                             total_size += file_size
             
             mail.send(msg)
-            logger.info(f"Email with attachments sent to {', '.join(recipients)}")
+            logger.info("Email with attachments sent to %s", ', '.join(recipients))
             return True
             
         except Exception as e:
@@ -252,7 +250,7 @@ class EmailService:
             )
             
         except Exception as e:
-            logger.error(f"Error sending templated email: {e}")
+            logger.error("Error sending templated email: %s", e)
             raise EmailError(f"Failed to send templated email: {e}") from e
 
 # Business-specific email functions
@@ -318,7 +316,7 @@ def send_sales_report_email(recipient: str, report_name: str, pdf_path: str,
         )
         
     except Exception as e:
-        logger.error(f"Error sending sales report email: {e}")
+        logger.error("Error sending sales report email: %s", e)
         raise EmailError(f"Failed to send sales report email: {e}") from e
 
 def send_order_confirmation_email(recipient: str, order_data: dict, sender: Optional[str] = None) -> bool:
@@ -402,7 +400,7 @@ def send_order_confirmation_email(recipient: str, order_data: dict, sender: Opti
         )
         
     except Exception as e:
-        logger.error(f"Error sending order confirmation email: {e}")
+        logger.error("Error sending order confirmation email: %s", e)
         raise EmailError(f"Failed to send order confirmation email: {e}") from e
 
 # Utility functions
@@ -412,9 +410,9 @@ def cleanup_temp_files(file_paths: List[str]) -> None:
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
-                logger.info(f"Cleaned up temporary file: {file_path}")
+                logger.info("Cleaned up temporary file: %s", file_path)
         except Exception as e:
-            logger.warning(f"Could not remove temporary file {file_path}: {e}")
+            logger.warning("Could not remove temporary file %s: %s", file_path, e)
 
 def test_email_configuration() -> bool:
     """Test email configuration"""
@@ -423,14 +421,14 @@ def test_email_configuration() -> bool:
         missing_attrs = [attr for attr in config_attrs if not hasattr(Config, attr)]
         
         if missing_attrs:
-            logger.error(f"Missing email configuration: {', '.join(missing_attrs)}")
+            logger.error("Missing email configuration: %s", ', '.join(missing_attrs))
             return False
         
         logger.info("Email configuration appears to be complete")
         return True
         
     except Exception as e:
-        logger.error(f"Error checking email configuration: {e}")
+        logger.error("Error checking email configuration: %s", e)
         return False
 
 # Export main service class and key functions
@@ -0,0 +1,7 @@
+import os
+
+# Image uploads spend most of their time waiting on Cloudinary, so let each
+# worker process serve several requests at once on threads instead of
+# parking the whole process on one upload.
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
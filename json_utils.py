@@ -0,0 +1,39 @@
+import orjson
+from decimal import Decimal
+from flask import make_response
+from flask.json.provider import JSONProvider
+
+
+def _default(obj):
+    """Fallback encoder for types orjson does not serialize natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def output_json(data, code, headers=None):
+    """Flask-RESTful JSON representation backed by orjson."""
+    response = make_response(orjson.dumps(data, default=_default), code)
+    response.headers.extend(headers or {})
+    response.headers['Content-Type'] = 'application/json'
+    return response
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify().
+
+    Datetimes are emitted as ISO 8601 like the Flask-RESTful representation,
+    so model as_dict values can be returned from either kind of view.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default), mimetype='application/json'
+        )
@@ -0,0 +1,30 @@
+"""add custom image indexes
+
+Revision ID: 7c41e9a2d5b8
+Revises: 2bbbad88039d
+Create Date: 2026-10-16 09:12:44.318205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c41e9a2d5b8'
+down_revision = '2bbbad88039d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('custom_images', schema=None) as batch_op:
+        batch_op.create_index('ix_custom_images_status_upload_date', ['approval_status', sa.text('upload_date DESC')], unique=False)
+        batch_op.create_index('ix_custom_images_user_upload_date', ['user_id', sa.text('upload_date DESC')], unique=False)
+        batch_op.create_index('ix_custom_images_order_item_id', ['order_item_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('custom_images', schema=None) as batch_op:
+        batch_op.drop_index('ix_custom_images_order_item_id')
+        batch_op.drop_index('ix_custom_images_user_upload_date')
+        batch_op.drop_index('ix_custom_images_status_upload_date')
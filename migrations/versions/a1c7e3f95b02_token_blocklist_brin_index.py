@@ -0,0 +1,26 @@
+"""token blocklist brin index
+
+Revision ID: a1c7e3f95b02
+Revises: f6a0d2b84c19
+Create Date: 2026-10-16 15:31:46.118520
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c7e3f95b02'
+down_revision = 'f6a0d2b84c19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('token_blocklist', schema=None) as batch_op:
+        batch_op.create_index('ix_token_blocklist_created_brin', ['created_at'], unique=False, postgresql_using='brin')
+
+
+def downgrade():
+    with op.batch_alter_table('token_blocklist', schema=None) as batch_op:
+        batch_op.drop_index('ix_token_blocklist_created_brin')
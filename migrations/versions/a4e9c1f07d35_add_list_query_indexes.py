@@ -0,0 +1,48 @@
+"""add list query indexes
+
+Revision ID: a4e9c1f07d35
+Revises: f1d83b6c2a90
+Create Date: 2026-10-16 12:31:17.684025
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4e9c1f07d35'
+down_revision = 'f1d83b6c2a90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_orders_user_id'))
+        batch_op.create_index('ix_orders_user_created', ['user_id', sa.text('created_at DESC')], unique=False)
+        batch_op.create_index('ix_orders_status_created', ['status', sa.text('created_at DESC')], unique=False)
+
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.create_index('ix_order_items_order_id', ['order_id'], unique=False)
+
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.create_index('ix_payments_order_date', ['order_id', sa.text('payment_date DESC')], unique=False)
+
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.create_index('ix_products_category_active', ['category_id', 'is_active'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.drop_index('ix_products_category_active')
+
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.drop_index('ix_payments_order_date')
+
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.drop_index('ix_order_items_order_id')
+
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_index('ix_orders_status_created')
+        batch_op.drop_index('ix_orders_user_created')
+        batch_op.create_index(batch_op.f('ix_orders_user_id'), ['user_id'], unique=False)
@@ -0,0 +1,32 @@
+"""add product and order user indexes
+
+Revision ID: b3f08d6e1a27
+Revises: 7c41e9a2d5b8
+Create Date: 2026-10-16 10:03:27.551940
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f08d6e1a27'
+down_revision = '7c41e9a2d5b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('custom_images', schema=None) as batch_op:
+        batch_op.create_index('ix_custom_images_product_id', ['product_id'], unique=False)
+
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_orders_user_id'), ['user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_orders_user_id'))
+
+    with op.batch_alter_table('custom_images', schema=None) as batch_op:
+        batch_op.drop_index('ix_custom_images_product_id')
@@ -0,0 +1,57 @@
+"""user permissions table
+
+Revision ID: b9e1f5c37a28
+Revises: e2c6a8d41f97
+Create Date: 2026-10-16 14:22:31.905173
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9e1f5c37a28'
+down_revision = 'e2c6a8d41f97'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_permissions',
+    sa.Column('user_id', postgresql.UUID(as_uuid=False), nullable=False),
+    sa.Column('permission', sa.String(length=64), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'permission')
+    )
+    with op.batch_alter_table('user_permissions', schema=None) as batch_op:
+        batch_op.create_index('ix_user_permissions_permission', ['permission'], unique=False)
+
+    op.execute("""
+        INSERT INTO user_permissions (user_id, permission)
+        SELECT DISTINCT users.id, trim(name)
+        FROM users, unnest(string_to_array(users.permissions, ',')) AS name
+        WHERE trim(name) <> ''
+    """)
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('permissions')
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('permissions', sa.Text(), nullable=True))
+
+    op.execute("""
+        UPDATE users SET permissions = grouped.names
+        FROM (
+            SELECT user_id, string_agg(permission, ',' ORDER BY permission) AS names
+            FROM user_permissions GROUP BY user_id
+        ) AS grouped
+        WHERE users.id = grouped.user_id
+    """)
+
+    with op.batch_alter_table('user_permissions', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_permissions_permission')
+
+    op.drop_table('user_permissions')
@@ -0,0 +1,34 @@
+"""set null on approver delete
+
+Revision ID: c3f8b0d62e47
+Revises: a1c7e3f95b02
+Create Date: 2026-10-16 15:58:03.671294
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f8b0d62e47'
+down_revision = 'a1c7e3f95b02'
+branch_labels = None
+depends_on = None
+
+
+FOREIGN_KEYS = [
+    ('orders', 'approved_by'),
+    ('report', 'generated_by_user_id'),
+]
+
+
+def upgrade():
+    for table, column in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+        op.create_foreign_key(f'{table}_{column}_fkey', table, 'users', [column], ['id'], ondelete='SET NULL')
+
+
+def downgrade():
+    for table, column in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+        op.create_foreign_key(f'{table}_{column}_fkey', table, 'users', [column], ['id'])
@@ -0,0 +1,36 @@
+"""report data jsonb
+
+Revision ID: c8b2d4e6f013
+Revises: a4e9c1f07d35
+Create Date: 2026-10-16 12:52:40.311948
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8b2d4e6f013'
+down_revision = 'a4e9c1f07d35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Reports used to store json.dumps() output, i.e. a JSON string holding
+    # the chart data; unwrap those into the object itself while converting.
+    op.alter_column(
+        'report', 'report_data',
+        type_=postgresql.JSONB(),
+        postgresql_using=(
+            "CASE WHEN json_typeof(report_data) = 'string' "
+            "THEN (report_data #>> '{}')::jsonb ELSE report_data::jsonb END"
+        )
+    )
+    op.create_index('ix_report_data_gin', 'report', ['report_data'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    op.drop_index('ix_report_data_gin', table_name='report')
+    op.alter_column('report', 'report_data', type_=sa.JSON(), postgresql_using='report_data::json')
@@ -0,0 +1,43 @@
+"""server default timestamps
+
+Revision ID: d7f3a9b25e61
+Revises: c8b2d4e6f013
+Create Date: 2026-10-16 13:20:05.842716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7f3a9b25e61'
+down_revision = 'c8b2d4e6f013'
+branch_labels = None
+depends_on = None
+
+
+TIMESTAMP_COLUMNS = [
+    ('token_blocklist', 'created_at'),
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('products', 'created_at'),
+    ('products', 'updated_at'),
+    ('pickup_points', 'created_at'),
+    ('pickup_points', 'updated'),
+    ('orders', 'created_at'),
+    ('orders', 'updated_at'),
+    ('order_items', 'created_at'),
+    ('payments', 'payment_date'),
+    ('custom_images', 'upload_date'),
+    ('report', 'generated_at'),
+]
+
+
+def upgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
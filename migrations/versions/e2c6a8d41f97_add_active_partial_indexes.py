@@ -0,0 +1,32 @@
+"""add active partial indexes
+
+Revision ID: e2c6a8d41f97
+Revises: d7f3a9b25e61
+Create Date: 2026-10-16 13:41:52.270384
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2c6a8d41f97'
+down_revision = 'd7f3a9b25e61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.create_index('ix_products_active_created', [sa.text('created_at DESC')], unique=False, postgresql_where=sa.text('is_active'))
+
+    with op.batch_alter_table('pickup_points', schema=None) as batch_op:
+        batch_op.create_index('ix_pickup_points_active_created', [sa.text('created_at DESC')], unique=False, postgresql_where=sa.text('is_active'))
+
+
+def downgrade():
+    with op.batch_alter_table('pickup_points', schema=None) as batch_op:
+        batch_op.drop_index('ix_pickup_points_active_created')
+
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.drop_index('ix_products_active_created')
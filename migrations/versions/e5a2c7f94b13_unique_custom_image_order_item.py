@@ -0,0 +1,28 @@
+"""unique custom image order item
+
+Revision ID: e5a2c7f94b13
+Revises: b3f08d6e1a27
+Create Date: 2026-10-16 10:41:09.204617
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a2c7f94b13'
+down_revision = 'b3f08d6e1a27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('custom_images', schema=None) as batch_op:
+        batch_op.drop_index('ix_custom_images_order_item_id')
+        batch_op.create_unique_constraint('uq_custom_images_order_item_id', ['order_item_id'])
+
+
+def downgrade():
+    with op.batch_alter_table('custom_images', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_custom_images_order_item_id', type_='unique')
+        batch_op.create_index('ix_custom_images_order_item_id', ['order_item_id'], unique=False)
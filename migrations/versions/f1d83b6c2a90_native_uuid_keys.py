@@ -0,0 +1,67 @@
+"""native uuid keys
+
+Revision ID: f1d83b6c2a90
+Revises: e5a2c7f94b13
+Create Date: 2026-10-16 12:08:44.517302
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1d83b6c2a90'
+down_revision = 'e5a2c7f94b13'
+branch_labels = None
+depends_on = None
+
+
+KEY_COLUMNS = {
+    'token_blocklist': ['id', 'user_id'],
+    'categories': ['id'],
+    'pickup_points': ['id'],
+    'users': ['id'],
+    'orders': ['id', 'user_id', 'pickup_point_id', 'approved_by'],
+    'products': ['id', 'category_id', 'created_by'],
+    'order_items': ['id', 'order_id', 'product_id'],
+    'payments': ['id', 'order_id'],
+    'report': ['id', 'top_selling_category_id', 'top_selling_product_id', 'generated_by_user_id'],
+    'custom_images': ['id', 'order_item_id', 'product_id', 'user_id', 'approved_by'],
+}
+
+FOREIGN_KEYS = [
+    ('orders', 'approved_by', 'users'),
+    ('orders', 'pickup_point_id', 'pickup_points'),
+    ('orders', 'user_id', 'users'),
+    ('products', 'category_id', 'categories'),
+    ('products', 'created_by', 'users'),
+    ('order_items', 'order_id', 'orders'),
+    ('order_items', 'product_id', 'products'),
+    ('payments', 'order_id', 'orders'),
+    ('report', 'generated_by_user_id', 'users'),
+    ('report', 'top_selling_category_id', 'categories'),
+    ('report', 'top_selling_product_id', 'products'),
+    ('custom_images', 'approved_by', 'users'),
+    ('custom_images', 'order_item_id', 'order_items'),
+    ('custom_images', 'product_id', 'products'),
+    ('custom_images', 'user_id', 'users'),
+]
+
+
+def _convert(type_, using):
+    for table, column, _ in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+    for table, columns in KEY_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=type_, postgresql_using=using.format(column))
+    for table, column, referent in FOREIGN_KEYS:
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referent, [column], ['id'])
+
+
+def upgrade():
+    _convert(postgresql.UUID(as_uuid=False), '{}::uuid')
+
+
+def downgrade():
+    _convert(sa.String(length=36), '{}::text')
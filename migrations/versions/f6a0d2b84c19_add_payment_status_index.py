@@ -0,0 +1,26 @@
+"""add payment status index
+
+Revision ID: f6a0d2b84c19
+Revises: b9e1f5c37a28
+Create Date: 2026-10-16 14:58:12.446630
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6a0d2b84c19'
+down_revision = 'b9e1f5c37a28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.create_index('ix_payments_status_date', ['status', sa.text('payment_date DESC')], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('payments', schema=None) as batch_op:
+        batch_op.drop_index('ix_payments_status_date')
@@ -1,20 +1,169 @@
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy import Text, String
+from sqlalchemy import Text, String, event, select
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import selectinload, load_only, lazyload
 from werkzeug.security import generate_password_hash, check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 import enum
+import os
+import time
 import uuid
 
-# Initialize SQLAlchemy
-db = SQLAlchemy()
+# Initialize SQLAlchemy. Objects stay loaded after commit so responses built
+# from them don't re-SELECT, and queries don't autoflush; write paths that
+# need generated values before commit call db.session.flush() explicitly.
+db = SQLAlchemy(session_options={'autoflush': False, 'expire_on_commit': False})
+
+# Timestamp columns are filled in by PostgreSQL, in UTC like datetime.utcnow
+UTC_NOW = db.text("timezone('utc', now())")
+
+class UUIDString(TypeDecorator):
+    """UUID key stored natively on PostgreSQL, exposed to Python as str.
+
+    Other dialects fall back to String(36). Values that are not valid
+    UUIDs bind as NULL, so a malformed id in a URL matches no row instead
+    of raising a database error. Attribute writes are checked separately by
+    _validate_uuid_columns, so a bad id is never stored as NULL.
+    """
+    impl = String(36)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(UUID(as_uuid=False))
+        return dialect.type_descriptor(String(36))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return str(uuid.UUID(str(value)))
+        except ValueError:
+            return None
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else str(value)
+
+def _valid_uuid(target, value, oldvalue, initiator):
+    if value is None:
+        return None
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        raise ValueError(f"Invalid id for {initiator.key}: {value!r}") from None
+
+def _validate_uuid_columns(model):
+    """Reject malformed ids assigned to the model's UUIDString columns."""
+    for column in model.__table__.columns:
+        if isinstance(column.type, UUIDString):
+            event.listen(getattr(model, column.key), 'set', _valid_uuid, retval=True)
+
+# Random bytes for new_id, read from the OS in blocks instead of per id
+_ID_RANDOM_BYTES = 10
+_ID_POOL_SIZE = 1024
+_id_random_pool = deque()
+# A forked worker must not hand out ids from its parent's pool
+os.register_at_fork(after_in_child=_id_random_pool.clear)
+
+def _id_random():
+    try:
+        return _id_random_pool.popleft()
+    except IndexError:
+        block = os.urandom(_ID_RANDOM_BYTES * _ID_POOL_SIZE)
+        _id_random_pool.extend(
+            block[i:i + _ID_RANDOM_BYTES] for i in range(0, len(block), _ID_RANDOM_BYTES)
+        )
+        return _id_random_pool.popleft()
+
+def new_id():
+    """Return a new UUIDv7 primary key string.
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows land
+    at the right-hand edge of the primary key indexes instead of at random
+    pages; the remaining 74 bits are random.
+    """
+    millis = time.time_ns() // 1_000_000
+    rand = int.from_bytes(_id_random(), 'big')
+    value = (
+        (millis & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76                          # version 7
+        | ((rand >> 62) & 0xFFF) << 64       # rand_a
+        | 0x2 << 62                          # RFC 4122 variant
+        | (rand & 0x3FFFFFFFFFFFFFFF)        # rand_b
+    )
+    return str(uuid.UUID(int=value))
+
+def _argon2_hasher():
+    config = current_app.config
+    return PasswordHasher(
+        time_cost=config.get('ARGON2_TIME_COST', 2),
+        memory_cost=config.get('ARGON2_MEMORY_COST', 64 * 1024),
+        parallelism=config.get('ARGON2_PARALLELISM', 1)
+    )
+
+def hash_password(password):
+    """Hash a password with the app's configured method.
+
+    "argon2" uses argon2-cffi; anything else is a werkzeug method string.
+    """
+    method = current_app.config.get('PASSWORD_HASH_METHOD', 'argon2')
+    if method == 'argon2':
+        return _argon2_hasher().hash(password)
+    return generate_password_hash(
+        password,
+        method=method,
+        salt_length=current_app.config.get('PASSWORD_HASH_SALT_LENGTH', 16)
+    )
+
+def verify_password(password_hash, password):
+    """Check a password against an argon2 or werkzeug hash."""
+    if password_hash.startswith('$argon2'):
+        try:
+            return _argon2_hasher().verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return check_password_hash(password_hash, password)
+
+def _cached_dict(instance):
+    """Return a copy of instance._build_dict(), cached on the instance.
+
+    The cache is dropped when a column is set or the row is expired or
+    refreshed; see _cache_dict_until_changed.
+    """
+    cached = instance.__dict__.get('_as_dict')
+    if cached is None:
+        cached = instance.__dict__['_as_dict'] = instance._build_dict()
+    return dict(cached)
+
+def _clear_cached_dict(target, *args):
+    target.__dict__.pop('_as_dict', None)
+    target.__dict__.pop('_permission_names', None)
+
+def _cache_dict_until_changed(model):
+    event.listen(model, 'expire', _clear_cached_dict)
+    event.listen(model, 'refresh', _clear_cached_dict)
+    event.listen(model, 'refresh_flush', _clear_cached_dict)
+    for column in model.__table__.columns:
+        event.listen(getattr(model, column.key), 'set', _clear_cached_dict)
 
 # Token Blocklist Model
 class TokenBlocklist(db.Model):
-    id = db.Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUIDString, primary_key=True, default=new_id)
     jti = db.Column(db.String(36), nullable=False, index=True)
-    user_id = db.Column(String(36), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    user_id = db.Column(UUIDString, nullable=False)
+    created_at = db.Column(db.DateTime, server_default=UTC_NOW)
+
+    # Rows are appended in created_at order, so a BRIN index stays tiny and
+    # still lets prune_token_blocklist find the expired range.
+    __table_args__ = (
+        db.Index('ix_token_blocklist_created_brin', created_at, postgresql_using='brin'),
+    )
 
 # Enum definitions
 class UserRole(enum.Enum):
@@ -47,39 +196,73 @@ class ImageApprovalStatus(enum.Enum):
     PENDING = "pending"
     APPROVED = "approved" 
     REJECTED = "rejected"
+
+# Enum member -> serialized value, built once for the as_dict methods
+_ROLE_STR = {m: m.value for m in UserRole}
+_ORDER_STATUS_STR = {m: m.value for m in OrderStatus}
+_PAYMENT_STATUS_STR = {m: m.value for m in PaymentStatus}
+_APPROVAL_STATUS_STR = {m: m.value for m in ImageApprovalStatus}
+
+_STAFF_ROLES = frozenset({UserRole.ADMIN, UserRole.STAFF})
+
 class User(db.Model):
     __tablename__ = 'users'
 
-    id = db.Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUIDString, primary_key=True, default=new_id)
     email = db.Column(db.String(255), nullable=False, unique=True)
     password = db.Column(db.String(255), nullable=False)
     name = db.Column(db.String(255), nullable=True)
     role = db.Column(db.Enum(UserRole), nullable=False, default=UserRole.CUSTOMER)
-    permissions = db.Column(db.Text, nullable=True)
     address = db.Column(db.Text, nullable=True)
     county = db.Column(db.String(255), nullable=True)
     is_active = db.Column(db.Boolean, default=True, nullable=False)
     phone = db.Column(db.String(255), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=db.func.timezone('utc', db.func.now()), nullable=False)
 
     # Relationships with cascade delete
     orders = db.relationship('Order', back_populates='user', foreign_keys='Order.user_id', lazy=True, cascade="all, delete-orphan")
-    approved_orders = db.relationship('Order', back_populates='approved_by_user', foreign_keys='Order.approved_by', lazy=True, cascade="all, delete-orphan")
-    generated_reports = db.relationship('Report', back_populates='generated_by_user', foreign_keys='Report.generated_by_user_id', lazy=True, cascade="all, delete-orphan")
-    created_products = db.relationship('Product', foreign_keys='Product.created_by', lazy=True, cascade="all, delete-orphan")
+    # Orders and reports outlive the admin who approved or generated them; the
+    # database clears the reference when the user is deleted.
+    approved_orders = db.relationship('Order', back_populates='approved_by_user', foreign_keys='Order.approved_by', lazy=True, passive_deletes=True)
+    generated_reports = db.relationship('Report', back_populates='generated_by_user', foreign_keys='Report.generated_by_user_id', lazy=True, passive_deletes=True)
+    created_products = db.relationship('Product', back_populates='creator', foreign_keys='Product.created_by', lazy=True, cascade="all, delete-orphan")
+    # Loaded on first access only; most User loads never look at permissions
+    permission_rows = db.relationship('UserPermission', back_populates='user', lazy='select', order_by='UserPermission.permission', cascade="all, delete-orphan")
+
+    @property
+    def permission_names(self):
+        """Permission names as a frozenset, cached until the rows change."""
+        names = self.__dict__.get('_permission_names')
+        if names is None:
+            names = self.__dict__['_permission_names'] = frozenset(row.permission for row in self.permission_rows)
+        return names
+
+    @property
+    def permissions(self):
+        """Comma-separated permission names, or None when there are none."""
+        return ','.join(sorted(self.permission_names)) or None
+
+    @permissions.setter
+    def permissions(self, value):
+        names = dict.fromkeys(p.strip() for p in (value or '').split(',') if p.strip())
+        # Keep the rows that stay so their primary keys are not deleted and
+        # re-inserted in the same flush.
+        existing = {row.permission: row for row in self.permission_rows}
+        self.permission_rows = [existing.get(name) or UserPermission(permission=name) for name in names]
+        _clear_cached_dict(self)
 
     def set_password(self, password):
-        self.password = generate_password_hash(password)
+        self.password = hash_password(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password, password)
+        return verify_password(self.password, password)
 
     def is_admin(self):
         return self.role == UserRole.ADMIN
 
     def is_staff(self):
-        return self.role in [UserRole.ADMIN, UserRole.STAFF]
+        return self.role in _STAFF_ROLES
 
     def is_customer(self):
         return self.role == UserRole.CUSTOMER
@@ -87,31 +270,47 @@ class User(db.Model):
     def has_permission(self, permission):
         if self.is_admin():
             return True
-        if not self.permissions:
-            return False
-        user_permissions = [p.strip() for p in self.permissions.split(',')]
-        return permission in user_permissions
+        return permission in self.permission_names
 
     def as_dict(self):
+        return _cached_dict(self)
+
+    def _build_dict(self):
         return {
             "id": self.id,
             "email": self.email,
             "name": self.name,
-            "role": self.role.value,
+            "role": _ROLE_STR[self.role],
             "permissions": self.permissions,
             "address": self.address,
             "county": self.county,
             "phone": self.phone,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
 
+_cache_dict_until_changed(User)
+for _event in ('append', 'remove', 'set'):
+    event.listen(User.permission_rows, _event, _clear_cached_dict)
+
+class UserPermission(db.Model):
+    __tablename__ = 'user_permissions'
+
+    user_id = db.Column(UUIDString, db.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    permission = db.Column(db.String(64), primary_key=True)
+
+    __table_args__ = (
+        db.Index('ix_user_permissions_permission', permission),
+    )
+
+    user = db.relationship('User', back_populates='permission_rows')
+
 # Category model
 class Category(db.Model):
     __tablename__ = 'categories'
 
-    id = db.Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUIDString, primary_key=True, default=new_id)
     name = db.Column(db.String(255), nullable=False, unique=True)
     description = db.Column(db.Text, nullable=True)
     is_active = db.Column(db.Boolean, default=True, nullable=False)
@@ -132,25 +331,38 @@ class Category(db.Model):
 class Product(db.Model):
     __tablename__ = 'products'
 
-    id = db.Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUIDString, primary_key=True, default=new_id)
     name = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text, nullable=True)
     price = db.Column(db.Numeric(10, 2), nullable=False)
     quantity = db.Column(db.Integer, nullable=False, default=0)
     image_url = db.Column(db.Text, nullable=True)
     is_active = db.Column(db.Boolean, default=True, nullable=False)
-    category_id = db.Column(String(36), db.ForeignKey('categories.id'), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    created_by = db.Column(String(36), db.ForeignKey('users.id'), nullable=True)
+    category_id = db.Column(UUIDString, db.ForeignKey('categories.id'), nullable=True)
+    created_at = db.Column(db.DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=db.func.timezone('utc', db.func.now()), nullable=False)
+    created_by = db.Column(UUIDString, db.ForeignKey('users.id'), nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_products_category_active', category_id, is_active),
+        db.Index('ix_products_active_created', created_at.desc(), postgresql_where=db.text('is_active')),
+    )
 
     # Relationships
-    category = db.relationship('Category', back_populates='products')
+    # as_dict always reads the category name
+    category = db.relationship('Category', back_populates='products', lazy='joined')
+    creator = db.relationship('User', back_populates='created_products', foreign_keys=[created_by])
     order_items = db.relationship('OrderItem', back_populates='product', lazy=True)
     custom_images = db.relationship('CustomImage', back_populates='product', lazy=True)
     top_selling_reports = db.relationship('Report', back_populates='top_selling_product', foreign_keys='Report.top_selling_product_id', lazy=True)
 
     def as_dict(self):
+        product_dict = _cached_dict(self)
+        # The category name lives on another row, so it is read fresh.
+        product_dict["category"] = self.category.name if self.category else None
+        return product_dict
+
+    def _build_dict(self):
         return {
             "id": self.id,
             "name": self.name,
@@ -160,24 +372,26 @@ class Product(db.Model):
             "image_url": self.image_url,
             "is_active": self.is_active,
             "category_id": self.category_id,
-            "category": self.category.name if self.category else None,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "category": None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
             "created_by": self.created_by
         }
 
+_cache_dict_until_changed(Product)
+
 # Pickup Point model
 class PickupPoint(db.Model):
     __tablename__ = 'pickup_points'
 
-    id = db.Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUIDString, primary_key=True, default=new_id)
     name = db.Column(db.String(255), nullable=False)
     location_details = db.Column(db.Text, nullable=True)
     city = db.Column(db.String(255), nullable=True)
     county = db.Column(db.String(255), nullable=True)
     is_active = db.Column(db.Boolean, default=True, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, server_default=UTC_NOW, nullable=False)
+    updated = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=db.func.timezone('utc', db.func.now()), nullable=False)
 
     # New fields
     cost = db.Column(db.Float, nullable=False)
@@ -186,6 +400,10 @@ class PickupPoint(db.Model):
     delivery_method = db.Column(db.String(100), nullable=False)
     contact_person = db.Column(db.String(255), nullable=True)
 
+    __table_args__ = (
+        db.Index('ix_pickup_points_active_created', created_at.desc(), postgresql_where=db.text('is_active')),
+    )
+
     # Relationships
     orders = db.relationship('Order', back_populates='pickup_point', lazy=True)
 
@@ -197,8 +415,8 @@ class PickupPoint(db.Model):
             "city": self.city,
             "county": self.county,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat(),
-            "updated": self.updated.isoformat(),
+            "created_at": self.created_at,
+            "updated": self.updated,
             "cost": self.cost,
             "phone_number": self.phone_number,
             "is_doorstep": self.is_doorstep,
@@ -213,8 +431,8 @@ class PickupPoint(db.Model):
 class Order(db.Model):
     __tablename__ = 'orders'
 
-    id = db.Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = db.Column(String(36), db.ForeignKey('users.id'), nullable=True)
+    id = db.Column(UUIDString, primary_key=True, default=new_id)
+    user_id = db.Column(UUIDString, db.ForeignKey('users.id'), nullable=True)
     order_number = db.Column(db.String(255), nullable=False, unique=True)
     status = db.Column(db.Enum(OrderStatus), nullable=False, default=OrderStatus.PENDING)
     total_amount = db.Column(db.Numeric(10, 2), nullable=True)
@@ -222,15 +440,21 @@ class Order(db.Model):
     customer_phone = db.Column(db.String(255), nullable=True)
     delivery_address = db.Column(db.Text, nullable=True)
     city = db.Column(db.String(255), nullable=True)
-    pickup_point_id = db.Column(String(36), db.ForeignKey('pickup_points.id'), nullable=True)
+    pickup_point_id = db.Column(UUIDString, db.ForeignKey('pickup_points.id'), nullable=True)
     order_notes = db.Column(db.Text, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    approved_by = db.Column(String(36), db.ForeignKey('users.id'), nullable=True)
+    created_at = db.Column(db.DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=db.func.timezone('utc', db.func.now()), nullable=False)
+    approved_by = db.Column(UUIDString, db.ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_orders_user_created', user_id, created_at.desc()),
+        db.Index('ix_orders_status_created', status, created_at.desc()),
+    )
 
     # Relationships
     user = db.relationship('User', back_populates='orders', foreign_keys=[user_id])
-    pickup_point = db.relationship('PickupPoint', back_populates='orders')
+    # as_dict always reads the pickup point name
+    pickup_point = db.relationship('PickupPoint', back_populates='orders', lazy='joined')
     approved_by_user = db.relationship('User', back_populates='approved_orders', foreign_keys=[approved_by])
     order_items = db.relationship('OrderItem', back_populates='order', lazy=True, cascade="all, delete-orphan")
     payments = db.relationship('Payment', back_populates='order', lazy=True)
@@ -238,41 +462,114 @@ class Order(db.Model):
    
 
     def as_dict(self):
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "order_number": self.order_number,
-            "status": self.status.value,
-            "total_amount": float(self.total_amount),
-            "customer_name": self.customer_name,
-            "customer_phone": self.customer_phone,
-            "delivery_address": self.delivery_address,
-            "city": self.city,
-            "pickup_point_id": self.pickup_point_id,
-            "pickup_point": self.pickup_point.name if self.pickup_point else None,
-            "order_notes": self.order_notes,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "approved_by": self.approved_by,
-            "order_items": [item.as_dict() for item in self.order_items] if self.order_items else []
-        }
+        pickup_point = self.pickup_point.name if self.pickup_point else None
+        return _order_dict(self, pickup_point, [item.as_dict() for item in self.order_items])
+
+    @classmethod
+    def with_items_query(cls):
+        """Query orders with their items and each item's product name.
+
+        Items come in one selectin batch per page of orders; products are
+        joined into that batch with only id and name loaded.
+        """
+        return cls.query.options(
+            selectinload(cls.order_items).joinedload(OrderItem.product).options(
+                load_only(Product.id, Product.name),
+                lazyload(Product.category)
+            )
+        )
+
+    @classmethod
+    def dict_query(cls):
+        """Query the order columns with the pickup point name joined in.
+
+        Rows from this feed as_dicts without loading Order instances. Filter
+        it with filter() on Order columns: filter_by() would apply to the
+        joined PickupPoint.
+        """
+        return db.session.query(
+            *cls.__table__.c, PickupPoint.name.label('pickup_point_name')
+        ).outerjoin(PickupPoint, cls.pickup_point_id == PickupPoint.id)
+
+    @classmethod
+    def as_dicts(cls, rows):
+        """Serialize a page of dict_query() rows, fetching all their items in one query.
+
+        Item rows come back as plain column tuples joined to the product
+        name, so no OrderItem or Product instances are loaded.
+        """
+        items_by_order = {}
+        order_ids = [row.id for row in rows]
+        if order_ids:
+            item_rows = db.session.execute(
+                select(
+                    OrderItem.id, OrderItem.order_id, OrderItem.product_id, Product.name,
+                    OrderItem.quantity, OrderItem.unit_price, OrderItem.total_price,
+                    OrderItem.custom_images, OrderItem.created_at
+                )
+                .outerjoin(Product, OrderItem.product_id == Product.id)
+                .where(OrderItem.order_id.in_(order_ids))
+            )
+            for item in item_rows:
+                items_by_order.setdefault(item.order_id, []).append(OrderItemView(
+                    id=item.id,
+                    order_id=item.order_id,
+                    product_id=item.product_id,
+                    product_name=item.name,
+                    quantity=item.quantity,
+                    unit_price=float(item.unit_price),
+                    total_price=float(item.total_price),
+                    custom_images=item.custom_images,
+                    created_at=item.created_at
+                ))
+        return [
+            _order_dict(row, row.pickup_point_name, items_by_order.get(row.id, []))
+            for row in rows
+        ]
+
+def _order_dict(order, pickup_point, order_items):
+    # Shared by Order.as_dict and Order.as_dicts; order is an Order or a
+    # dict_query() row, which expose the same column attributes.
+    return {
+        "id": order.id,
+        "user_id": order.user_id,
+        "order_number": order.order_number,
+        "status": _ORDER_STATUS_STR[order.status],
+        "total_amount": float(order.total_amount),
+        "customer_name": order.customer_name,
+        "customer_phone": order.customer_phone,
+        "delivery_address": order.delivery_address,
+        "city": order.city,
+        "pickup_point_id": order.pickup_point_id,
+        "pickup_point": pickup_point,
+        "order_notes": order.order_notes,
+        "created_at": order.created_at,
+        "updated_at": order.updated_at,
+        "approved_by": order.approved_by,
+        "order_items": order_items
+    }
 
 # Order Item model
 class OrderItem(db.Model):
     __tablename__ = 'order_items'
 
-    id = db.Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    order_id = db.Column(String(36), db.ForeignKey('orders.id'), nullable=False)
-    product_id = db.Column(String(36), db.ForeignKey('products.id'), nullable=False)
+    id = db.Column(UUIDString, primary_key=True, default=new_id)
+    order_id = db.Column(UUIDString, db.ForeignKey('orders.id'), nullable=False)
+    product_id = db.Column(UUIDString, db.ForeignKey('products.id'), nullable=False)
     quantity = db.Column(db.Integer, nullable=False)
     unit_price = db.Column(db.Numeric(10, 2), nullable=False)
     custom_images = db.Column(db.Boolean, default=False, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, server_default=UTC_NOW, nullable=False)
     total_price = db.Column(db.Numeric(10, 2), nullable=False)
 
+    __table_args__ = (
+        db.Index('ix_order_items_order_id', order_id),
+    )
+
     # Relationships
     order = db.relationship('Order', back_populates='order_items')
-    product = db.relationship('Product', back_populates='order_items')
+    # as_dict always reads the product name
+    product = db.relationship('Product', back_populates='order_items', lazy='joined')
     custom_images_list = db.relationship('CustomImage', back_populates='order_item', lazy=True)
 
    
@@ -286,21 +583,47 @@ class OrderItem(db.Model):
             "unit_price": float(self.unit_price),
             "total_price": float(self.total_price),
             "custom_images": self.custom_images,
-            "created_at": self.created_at.isoformat()
+            "created_at": self.created_at
         }
 
+@dataclass(frozen=True)
+class OrderItemView:
+    """Serialized OrderItem for order listings that go straight to the response.
+
+    orjson encodes dataclasses natively, so Order.as_dicts skips a per-item
+    dict. Code that reads or extends item fields should use as_dict instead.
+    __slots__ is declared by hand because dataclass(slots=True) needs
+    Python 3.10.
+    """
+    __slots__ = ('id', 'order_id', 'product_id', 'product_name', 'quantity',
+                 'unit_price', 'total_price', 'custom_images', 'created_at')
+    id: str
+    order_id: str
+    product_id: str
+    product_name: str
+    quantity: int
+    unit_price: float
+    total_price: float
+    custom_images: bool
+    created_at: datetime
+
 # Payment model
 class Payment(db.Model):
     __tablename__ = 'payments'
 
-    id = db.Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    order_id = db.Column(String(36), db.ForeignKey('orders.id'), nullable=False)
+    id = db.Column(UUIDString, primary_key=True, default=new_id)
+    order_id = db.Column(UUIDString, db.ForeignKey('orders.id'), nullable=False)
     mpesa_code = db.Column(db.String(255), nullable=True)
     amount = db.Column(db.Numeric(10, 2), nullable=False)
     status = db.Column(db.Enum(PaymentStatus), nullable=False, default=PaymentStatus.PENDING)
-    payment_date = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    payment_date = db.Column(db.DateTime, server_default=UTC_NOW, nullable=False)
     phone_number = db.Column(db.String(255), nullable=False)
 
+    __table_args__ = (
+        db.Index('ix_payments_order_date', order_id, payment_date.desc()),
+        db.Index('ix_payments_status_date', status, payment_date.desc()),
+    )
+
     # Relationships
     order = db.relationship('Order', back_populates='payments')
 
@@ -310,40 +633,53 @@ class Payment(db.Model):
             "order_id": self.order_id,
             "mpesa_code": self.mpesa_code,
             "amount": float(self.amount),
-            "status": self.status.value,
-            "payment_date": self.payment_date.isoformat(),
+            "status": _PAYMENT_STATUS_STR[self.status],
+            "payment_date": self.payment_date,
             "phone_number": self.phone_number
         }
 class CustomImage(db.Model):
     __tablename__ = 'custom_images'
      
-    id = db.Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUIDString, primary_key=True, default=new_id)
  
-    order_item_id = db.Column(String(36), db.ForeignKey('order_items.id'), nullable=True)
-    product_id = db.Column(String(36), db.ForeignKey('products.id'), nullable=True)
+    order_item_id = db.Column(UUIDString, db.ForeignKey('order_items.id'), nullable=True)
+    product_id = db.Column(UUIDString, db.ForeignKey('products.id'), nullable=True)
    
-    user_id = db.Column(String(36), db.ForeignKey('users.id'), nullable=False)
+    user_id = db.Column(UUIDString, db.ForeignKey('users.id'), nullable=False)
     image_url = db.Column(db.Text, nullable=False)
     image_name = db.Column(db.String(255), nullable=True)
     cloudinary_public_id = db.Column(db.String(255), nullable=True)
-    upload_date = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    upload_date = db.Column(db.DateTime, server_default=UTC_NOW, nullable=False)
     
     
     is_temporary = db.Column(db.Boolean, default=False, nullable=False)
     
  
     approval_status = db.Column(db.Enum(ImageApprovalStatus), default=ImageApprovalStatus.PENDING, nullable=False)
-    approved_by = db.Column(String(36), db.ForeignKey('users.id'), nullable=True)
+    approved_by = db.Column(UUIDString, db.ForeignKey('users.id'), nullable=True)
     approval_date = db.Column(db.DateTime, nullable=True)
     rejection_reason = db.Column(db.Text, nullable=True)
  
    
+    # Match the listing queries: admin status filter and per-user history,
+    # both ordered newest first, and product filters. The unique order item
+    # constraint also backs order item lookups and stops duplicate uploads.
+    __table_args__ = (
+        db.Index('ix_custom_images_status_upload_date', approval_status, upload_date.desc()),
+        db.Index('ix_custom_images_user_upload_date', user_id, upload_date.desc()),
+        db.UniqueConstraint(order_item_id, name='uq_custom_images_order_item_id'),
+        db.Index('ix_custom_images_product_id', product_id),
+    )
+
     order_item = db.relationship('OrderItem', back_populates='custom_images_list')
     product = db.relationship('Product', back_populates='custom_images')
     approver = db.relationship('User', foreign_keys=[approved_by])
     uploader = db.relationship('User', foreign_keys=[user_id])
  
     def as_dict(self):
+        return _cached_dict(self)
+
+    def _build_dict(self):
         return {
             "id": self.id,
             "order_item_id": self.order_item_id,
@@ -351,21 +687,23 @@ class CustomImage(db.Model):
             "user_id": self.user_id,
             "image_url": self.image_url,
             "image_name": self.image_name,
-            "upload_date": self.upload_date.isoformat(),
+            "upload_date": self.upload_date,
             "is_temporary": self.is_temporary,
-            "approval_status": self.approval_status.value,
+            "approval_status": _APPROVAL_STATUS_STR[self.approval_status],
             "approved_by": self.approved_by,
-            "approval_date": self.approval_date.isoformat() if self.approval_date else None,
+            "approval_date": self.approval_date,
             "rejection_reason": self.rejection_reason
         }
 
+_cache_dict_until_changed(CustomImage)
+
 # Report model
 class Report(db.Model):
     __tablename__ = 'report'
 
-    id = db.Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUIDString, primary_key=True, default=new_id)
     report_name = db.Column(db.String(255), nullable=False)
-    generated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    generated_at = db.Column(db.DateTime, server_default=UTC_NOW, nullable=False)
     start_date = db.Column(db.DateTime, nullable=True)
     end_date = db.Column(db.DateTime, nullable=True)
     total_orders = db.Column(db.Integer, nullable=False, default=0)
@@ -373,29 +711,35 @@ class Report(db.Model):
     total_products_sold = db.Column(db.Integer, nullable=False, default=0)
 
     # Foreign keys for relationships
-    top_selling_category_id = db.Column(String(36), db.ForeignKey('categories.id'), nullable=True)
-    top_selling_product_id = db.Column(String(36), db.ForeignKey('products.id'), nullable=True)
-    generated_by_user_id = db.Column(String(36), db.ForeignKey('users.id'), nullable=True)
+    top_selling_category_id = db.Column(UUIDString, db.ForeignKey('categories.id'), nullable=True)
+    top_selling_product_id = db.Column(UUIDString, db.ForeignKey('products.id'), nullable=True)
+    generated_by_user_id = db.Column(UUIDString, db.ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
 
     pending_orders = db.Column(db.Integer, nullable=False, default=0)
     complete_orders = db.Column(db.Integer, nullable=False, default=0)
     failed_payments = db.Column(db.Integer, nullable=False, default=0)
-    summary = db.Column(db.Text, nullable=True)
+    # Only single-report views read these, so listings don't fetch them;
+    # both load together on first access.
+    summary = db.deferred(db.Column(db.Text, nullable=True), group='report_body')
+
+    report_data = db.deferred(db.Column(JSONB().with_variant(db.JSON(), 'sqlite'), nullable=False, default=dict), group='report_body')
 
-    report_data = db.Column(db.JSON, nullable=False, default=dict)
+    __table_args__ = (
+        db.Index('ix_report_data_gin', 'report_data', postgresql_using='gin'),
+    )
 
     # Relationships
-    top_selling_category = db.relationship('Category', foreign_keys=[top_selling_category_id])
-    top_selling_product = db.relationship('Product', foreign_keys=[top_selling_product_id])
-    generated_by_user = db.relationship('User', foreign_keys=[generated_by_user_id])
+    top_selling_category = db.relationship('Category', back_populates='top_selling_reports', foreign_keys=[top_selling_category_id])
+    top_selling_product = db.relationship('Product', back_populates='top_selling_reports', foreign_keys=[top_selling_product_id])
+    generated_by_user = db.relationship('User', back_populates='generated_reports', foreign_keys=[generated_by_user_id])
 
     def as_dict(self):
         return {
             "id": self.id,
             "report_name": self.report_name,
-            "generated_at": self.generated_at.isoformat(),
-            "start_date": self.start_date.isoformat() if self.start_date else None,
-            "end_date": self.end_date.isoformat() if self.end_date else None,
+            "generated_at": self.generated_at,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
             "total_orders": self.total_orders,
             "total_revenue": float(self.total_revenue),
             "total_products_sold": self.total_products_sold,
@@ -411,3 +755,6 @@ class Report(db.Model):
             "summary": self.summary,
             "report_data": self.report_data
         }
+
+for _mapper in db.Model.registry.mappers:
+    _validate_uuid_columns(_mapper.class_)
@@ -9,9 +9,9 @@ import logging
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from decimal import Decimal
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
 def generate_order_number():
     """Generate a unique order number."""
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
@@ -44,7 +44,7 @@ class OrderResource(Resource):
                     return order.as_dict(), 200
                 return {"message": "Order not found"}, 404
             except (OperationalError, SQLAlchemyError) as e:
-                logger.error(f"Database error: {str(e)}")
+                logger.error("Database error: %s", e)
                 return {"message": "Database connection error"}, 500
         
         # Get query parameters for pagination and filtering
@@ -56,23 +56,23 @@ class OrderResource(Resource):
             # Build query based on user role
             if user.role == UserRole.ADMIN:
                 # Admin can see all orders
-                query = Order.query
+                query = Order.dict_query()
             else:
                 # Regular user can only see their own orders
-                query = Order.query.filter_by(user_id=current_user_id)
+                query = Order.dict_query().filter(Order.user_id == current_user_id)
             
             # Filter by status if provided
             if status:
                 try:
                     status_enum = OrderStatus(status.lower())
-                    query = query.filter_by(status=status_enum)
+                    query = query.filter(Order.status == status_enum)
                 except ValueError:
                     return {"message": "Invalid status value"}, 400
             
             # Order by created_at descending
             query = query.order_by(Order.created_at.desc())
             
-            # Get orders with pagination
+            # Get order rows with pagination
             orders = query.paginate(page=page, per_page=per_page, error_out=False)
             
             if not orders.items:
@@ -84,17 +84,17 @@ class OrderResource(Resource):
                 }
             
             return {
-                'orders': [order.as_dict() for order in orders.items],
+                'orders': Order.as_dicts(orders.items),
                 'total': orders.total,
                 'pages': orders.pages,
                 'current_page': orders.page
             }, 200
             
         except (OperationalError, SQLAlchemyError) as e:
-            logger.error(f"Database error: {str(e)}")
+            logger.error("Database error: %s", e)
             return {"message": "Database connection error"}, 500
         except Exception as e:
-            logger.error(f"Error fetching orders: {str(e)}")
+            logger.error("Error fetching orders: %s", e)
             return {"message": "Error fetching orders"}, 500
 
     @jwt_required()
@@ -151,6 +151,13 @@ class OrderResource(Resource):
                     'total_price': item_total
                 })
 
+            # Validate pickup point if provided
+            pickup_point_id = data.get("pickup_point_id")
+            if pickup_point_id:
+                pickup_point = PickupPoint.query.get(pickup_point_id)
+                if not pickup_point or not pickup_point.is_active:
+                    return {"message": "Invalid or inactive pickup point"}, 400
+
             # Generate unique order number
             order_number = generate_order_number()
             while Order.query.filter_by(order_number=order_number).first():
@@ -167,7 +174,7 @@ class OrderResource(Resource):
                 customer_phone=data.get("customer_phone"),
                 delivery_address=data.get("delivery_address"),
                 city=data.get("city"),
-                pickup_point_id=data.get("pickup_point_id"),
+                pickup_point_id=pickup_point_id,
                 order_notes=data.get("order_notes")
             )
 
@@ -199,7 +206,7 @@ class OrderResource(Resource):
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error creating order: {str(e)}")
+            logger.error("Error creating order: %s", e)
             return {"error": str(e)}, 500
 
     @jwt_required()
@@ -263,7 +270,7 @@ class OrderResource(Resource):
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error updating order: {str(e)}")
+            logger.error("Error updating order: %s", e)
             return {"error": str(e)}, 500
 
     @jwt_required()
@@ -358,7 +365,7 @@ class OrderResource(Resource):
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error modifying order items: {str(e)}")
+            logger.error("Error modifying order items: %s", e)
             return {"error": str(e)}, 500
     @jwt_required()
     def put(self, order_id):
@@ -430,7 +437,7 @@ class OrderResource(Resource):
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error updating order: {str(e)}")
+            logger.error("Error updating order: %s", e)
             return {"error": f"An error occurred: {str(e)}"}, 500
 
     @jwt_required()
@@ -472,7 +479,7 @@ class OrderResource(Resource):
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error cancelling order id {order_id}: {str(e)}", exc_info=True)
+            logger.error("Error cancelling order id %s: %s", order_id, e, exc_info=True)
             return {"error": "An unexpected error occurred during order cancellation."}, 500
 
 
@@ -494,30 +501,30 @@ class AdminOrdersResource(Resource):
             status = request.args.get('status', type=str)
             
             # Build query
-            query = Order.query
+            query = Order.dict_query()
             
             # Filter by status if provided
             if status:
                 try:
                     status_enum = OrderStatus(status.lower())
-                    query = query.filter_by(status=status_enum)
+                    query = query.filter(Order.status == status_enum)
                 except ValueError:
                     return {"message": "Invalid status value"}, 400
             
-            # Get all orders with pagination
+            # Get all order rows with pagination
             orders = query.order_by(Order.created_at.desc()).paginate(
                 page=page, per_page=per_page, error_out=False
             )
             
             return {
-                'orders': [order.as_dict() for order in orders.items],
+                'orders': Order.as_dicts(orders.items),
                 'total': orders.total,
                 'pages': orders.pages,
                 'current_page': orders.page
             }, 200
             
         except Exception as e:
-            logger.error(f"Error fetching admin orders: {str(e)}")
+            logger.error("Error fetching admin orders: %s", e)
             return {"message": "Error fetching orders"}, 500
 
 
@@ -564,7 +571,7 @@ class OrderStatusResource(Resource):
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error updating order status: {str(e)}")
+            logger.error("Error updating order status: %s", e)
             return {"error": f"An error occurred: {str(e)}"}, 500
 
 
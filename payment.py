@@ -7,9 +7,9 @@ from model import db, Payment, PaymentStatus, Order, OrderStatus, User, UserRole
 from flask_jwt_extended import jwt_required, get_jwt_identity
 import logging
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.orm import joinedload, contains_eager
 from decimal import Decimal
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class PaymentResource(Resource):
@@ -37,7 +37,7 @@ class PaymentResource(Resource):
                     return payment.as_dict(), 200
                 return {"message": "Payment not found"}, 404
             except (OperationalError, SQLAlchemyError) as e:
-                logger.error(f"Database error: {str(e)}")
+                logger.error("Database error: %s", e)
                 return {"message": "Database connection error"}, 500
 
         page = request.args.get('page', 1, type=int)
@@ -81,10 +81,10 @@ class PaymentResource(Resource):
             }, 200
 
         except (OperationalError, SQLAlchemyError) as e:
-            logger.error(f"Database error: {str(e)}")
+            logger.error("Database error: %s", e)
             return {"message": "Database connection error"}, 500
         except Exception as e:
-            logger.error(f"Error fetching payments: {str(e)}")
+            logger.error("Error fetching payments: %s", e)
             return {"message": "Error fetching payments"}, 500
 
     @jwt_required()
@@ -153,7 +153,7 @@ class PaymentResource(Resource):
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error submitting payment: {str(e)}")
+            logger.error("Error submitting payment: %s", e)
             return {"error": str(e)}, 500
 
     @jwt_required()
@@ -207,7 +207,7 @@ class PaymentResource(Resource):
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error updating payment: {str(e)}")
+            logger.error("Error updating payment: %s", e)
             return {"error": f"An error occurred: {str(e)}"}, 500
 
     @jwt_required()
@@ -240,7 +240,7 @@ class PaymentResource(Resource):
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error deleting payment id {payment_id}: {str(e)}", exc_info=True)
+            logger.error("Error deleting payment id %s: %s", payment_id, e, exc_info=True)
             return {"error": "An unexpected error occurred during payment deletion."}, 500
 
 class PaymentVerificationResource(Resource):
@@ -292,7 +292,7 @@ class PaymentVerificationResource(Resource):
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error verifying payment: {str(e)}")
+            logger.error("Error verifying payment: %s", e)
             return {"error": f"An error occurred: {str(e)}"}, 500
 
 class AdminPaymentsResource(Resource):
@@ -312,7 +312,8 @@ class AdminPaymentsResource(Resource):
             per_page = request.args.get('per_page', 10, type=int)
             status = request.args.get('status', type=str)
 
-            query = Payment.query
+            # Orders are joined in so order_info needs no query per payment
+            query = Payment.query.options(joinedload(Payment.order))
 
             if status:
                 try:
@@ -328,7 +329,7 @@ class AdminPaymentsResource(Resource):
             payment_data = []
             for payment in payments.items:
                 payment_dict = payment.as_dict()
-                order = Order.query.get(payment.order_id)
+                order = payment.order
                 if order:
                     payment_dict['order_info'] = {
                         'order_number': order.order_number,
@@ -346,7 +347,7 @@ class AdminPaymentsResource(Resource):
             }, 200
 
         except Exception as e:
-            logger.error(f"Error fetching admin payments: {str(e)}")
+            logger.error("Error fetching admin payments: %s", e)
             return {"message": "Error fetching payments"}, 500
 
 class PaymentStatusResource(Resource):
@@ -384,8 +385,8 @@ class PaymentStatusResource(Resource):
                     "mpesa_code": payment.mpesa_code,
                     "phone_number": payment.phone_number,
                     "status": payment.status.value,
-                    "payment_date": payment.payment_date.isoformat() if payment.payment_date else None,
-                    "verification_date": payment.verification_date.isoformat() if payment.verification_date else None,
+                    "payment_date": payment.payment_date,
+                    "verification_date": payment.verification_date,
                     "order_status": order.status.value if order else None,
                     "is_completed": payment.status == PaymentStatus.COMPLETED,
                     "is_failed": payment.status == PaymentStatus.FAILED,
@@ -398,16 +399,19 @@ class PaymentStatusResource(Resource):
                         status_info["verified_by"] = {
                             "admin_id": admin_user.id,
                             "admin_name": f"{admin_user.first_name} {admin_user.last_name}",
-                            "verification_date": order.updated_at.isoformat() if order.updated_at else None
+                            "verification_date": order.updated_at
                         }
 
                 return status_info, 200
 
             else:
                 if user.role == UserRole.ADMIN:
-                    query = Payment.query
+                    query = Payment.query.options(joinedload(Payment.order))
                 else:
-                    query = Payment.query.join(Order).filter(Order.user_id == current_user_id)
+                    # Reuse the ownership join to populate payment.order.
+                    query = Payment.query.join(Order).filter(
+                        Order.user_id == current_user_id
+                    ).options(contains_eager(Payment.order))
 
                 status_filter = request.args.get('status', type=str)
                 order_id_filter = request.args.get('order_id', type=str)
@@ -426,7 +430,7 @@ class PaymentStatusResource(Resource):
 
                 payment_statuses = []
                 for payment in payments:
-                    order = Order.query.get(payment.order_id)
+                    order = payment.order
 
                     status_info = {
                         "payment_id": payment.id,
@@ -434,8 +438,8 @@ class PaymentStatusResource(Resource):
                         "order_number": order.order_number if order else None,
                         "amount": float(payment.amount),
                         "status": payment.status.value,
-                        "payment_date": payment.payment_date.isoformat() if payment.payment_date else None,
-                        "verification_date": payment.verification_date.isoformat() if payment.verification_date else None,
+                        "payment_date": payment.payment_date,
+                        "verification_date": payment.verification_date,
                         "is_completed": payment.status == PaymentStatus.COMPLETED,
                         "is_failed": payment.status == PaymentStatus.FAILED,
                         "is_pending": payment.status == PaymentStatus.PENDING
@@ -449,7 +453,7 @@ class PaymentStatusResource(Resource):
                 }, 200
 
         except Exception as e:
-            logger.error(f"Error fetching payment status: {str(e)}")
+            logger.error("Error fetching payment status: %s", e)
             return {"message": "Error fetching payment status"}, 500
 
 class OrderPaymentStatusResource(Resource):
@@ -489,8 +493,8 @@ class OrderPaymentStatusResource(Resource):
                     "payment_status": payment.status.value,
                     "mpesa_code": payment.mpesa_code,
                     "payment_amount": float(payment.amount),
-                    "payment_date": payment.payment_date.isoformat() if payment.payment_date else None,
-                    "verification_date": payment.verification_date.isoformat() if payment.verification_date else None,
+                    "payment_date": payment.payment_date,
+                    "verification_date": payment.verification_date,
                     "is_completed": payment.status == PaymentStatus.COMPLETED,
                     "is_failed": payment.status == PaymentStatus.FAILED,
                     "is_pending": payment.status == PaymentStatus.PENDING
@@ -501,7 +505,7 @@ class OrderPaymentStatusResource(Resource):
                     if admin_user:
                         response_data["verified_by"] = {
                             "admin_name": f"{admin_user.first_name} {admin_user.last_name}",
-                            "verification_date": order.updated_at.isoformat() if order.updated_at else None
+                            "verification_date": order.updated_at
                         }
             else:
                 response_data.update({
@@ -512,7 +516,7 @@ class OrderPaymentStatusResource(Resource):
             return response_data, 200
 
         except Exception as e:
-            logger.error(f"Error fetching order payment status: {str(e)}")
+            logger.error("Error fetching order payment status: %s", e)
             return {"message": "Error fetching order payment status"}, 500
 
 def register_payment_resources(api):
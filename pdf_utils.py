@@ -10,8 +10,6 @@ from datetime import datetime
 from typing import Dict, Tuple, List, Optional
 import numpy as np
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class SalesReportConfig:
@@ -90,7 +88,7 @@ class DataValidator:
             try:
                 validated[key] = float(value) if value is not None else 0.0
             except (ValueError, TypeError):
-                logger.warning(f"Invalid numeric value for {key}: {value}, setting to 0")
+                logger.warning("Invalid numeric value for %s: %s, setting to 0", key, value)
                 validated[key] = 0.0
         return validated
 
@@ -194,11 +192,11 @@ class ChartGenerator:
             plt.savefig(path, transparent=False, dpi=300, bbox_inches='tight',
                         facecolor=fig.get_facecolor(), edgecolor='none')
 
-            logger.info(f"Enhanced revenue chart saved to {path}")
+            logger.info("Enhanced revenue chart saved to %s", path)
             return path
 
         except Exception as e:
-            logger.error(f"Error generating revenue chart: {e}")
+            logger.error("Error generating revenue chart: %s", e)
             return self._create_error_chart(path, "Chart Generation Error")
         finally:
             plt.close('all')
@@ -270,11 +268,11 @@ class ChartGenerator:
             plt.savefig(path, transparent=False, dpi=300, bbox_inches='tight',
                         facecolor=fig.get_facecolor(), edgecolor='none')
 
-            logger.info(f"Enhanced product sales chart saved to {path}")
+            logger.info("Enhanced product sales chart saved to %s", path)
             return path
 
         except Exception as e:
-            logger.error(f"Error generating product sales chart: {e}")
+            logger.error("Error generating product sales chart: %s", e)
             return self._create_error_chart(path, "Chart Generation Error")
         finally:
             plt.close('all')
@@ -350,7 +348,7 @@ class SalesReportGenerator:
 
             # Build PDF
             doc.build(elements)
-            logger.info(f"Comprehensive sales report generated: {pdf_path}")
+            logger.info("Comprehensive sales report generated: %s", pdf_path)
 
             # Cleanup temporary files
             self._cleanup_temp_files(report_id)
@@ -358,7 +356,7 @@ class SalesReportGenerator:
             return pdf_path
 
         except Exception as e:
-            logger.error(f"Error generating comprehensive report: {e}")
+            logger.error("Error generating comprehensive report: %s", e)
             if os.path.exists(pdf_path):
                 os.remove(pdf_path)
             return ""
@@ -418,11 +416,11 @@ class SalesReportGenerator:
             # Build the PDF
             doc.build(elements)
 
-            logger.info(f"Order history report generated: {pdf_path}")
+            logger.info("Order history report generated: %s", pdf_path)
             return pdf_path
 
         except Exception as e:
-            logger.error(f"Error generating order history report: {e}")
+            logger.error("Error generating order history report: %s", e)
             return ""
 
     def _generate_all_charts(self, report: Dict, report_id: str) -> Dict[str, str]:
@@ -561,7 +559,7 @@ class SalesReportGenerator:
                 elements.append(img)
                 elements.append(Spacer(1, 20))
             except Exception as e:
-                logger.error(f"Could not embed revenue chart: {e}")
+                logger.error("Could not embed revenue chart: %s", e)
 
         # Product Performance
         if charts.get('products') and os.path.exists(charts['products']):
@@ -574,7 +572,7 @@ class SalesReportGenerator:
                 elements.append(img)
                 elements.append(Spacer(1, 30))
             except Exception as e:
-                logger.error(f"Could not embed product chart: {e}")
+                logger.error("Could not embed product chart: %s", e)
 
         return elements
 
@@ -622,9 +620,9 @@ class SalesReportGenerator:
             try:
                 if os.path.exists(file_path):
                     os.remove(file_path)
-                    logger.debug(f"Cleaned up temporary file: {file_path}")
+                    logger.debug("Cleaned up temporary file: %s", file_path)
             except Exception as e:
-                logger.warning(f"Could not remove temporary file {file_path}: {e}")
+                logger.warning("Could not remove temporary file %s: %s", file_path, e)
 
 # Convenience functions for backward compatibility
 def generate_comprehensive_sales_report_pdf(report: dict, report_id: str, pdf_path: str = "sales_report.pdf") -> str:
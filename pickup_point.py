@@ -7,7 +7,6 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 import logging
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -22,7 +21,7 @@ class PickupPointResource(Resource):
                     return pickup_point.as_dict(), 200
                 return {"message": "Pickup point not found"}, 404
             except (OperationalError, SQLAlchemyError) as e:
-                logger.error(f"Database error: {str(e)}")
+                logger.error("Database error: %s", e)
                 return {"message": "Database connection error"}, 500
 
         # Get query parameters for pagination and filtering
@@ -74,10 +73,10 @@ class PickupPointResource(Resource):
             }, 200
 
         except (OperationalError, SQLAlchemyError) as e:
-            logger.error(f"Database error: {str(e)}")
+            logger.error("Database error: %s", e)
             return {"message": "Database connection error"}, 500
         except Exception as e:
-            logger.error(f"Error fetching pickup points: {str(e)}")
+            logger.error("Error fetching pickup points: %s", e)
             return {"message": "Error fetching pickup points"}, 500
 
     @jwt_required()
@@ -135,11 +134,11 @@ class PickupPointResource(Resource):
 
         except (OperationalError, SQLAlchemyError) as e:
             db.session.rollback()
-            logger.error(f"Database error during pickup point creation: {str(e)}")
+            logger.error("Database error during pickup point creation: %s", e)
             return {"message": "Database connection error or operation failed"}, 500
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error creating pickup point: {str(e)}", exc_info=True)
+            logger.error("Error creating pickup point: %s", e, exc_info=True)
             return {"error": f"An unexpected error occurred: {str(e)}"}, 500
 
     @jwt_required()
@@ -207,11 +206,11 @@ class PickupPointResource(Resource):
 
         except (OperationalError, SQLAlchemyError) as e:
             db.session.rollback()
-            logger.error(f"Database error during pickup point update: {str(e)}")
+            logger.error("Database error during pickup point update: %s", e)
             return {"message": "Database connection error or operation failed"}, 500
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error updating pickup point: {str(e)}", exc_info=True)
+            logger.error("Error updating pickup point: %s", e, exc_info=True)
             return {"error": f"An unexpected error occurred: {str(e)}"}, 500
 
     @jwt_required()
@@ -238,11 +237,11 @@ class PickupPointResource(Resource):
 
         except (OperationalError, SQLAlchemyError) as e:
             db.session.rollback()
-            logger.error(f"Database error during pickup point deletion: {str(e)}")
+            logger.error("Database error during pickup point deletion: %s", e)
             return {"message": "Database connection error or operation failed."}, 500
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error deleting pickup point id {pickup_point_id}: {str(e)}", exc_info=True)
+            logger.error("Error deleting pickup point id %s: %s", pickup_point_id, e, exc_info=True)
             return {"error": "An unexpected error occurred during pickup point deletion."}, 500
 
 
@@ -268,10 +267,10 @@ class PickupPointByCityResource(Resource):
             }, 200
 
         except (OperationalError, SQLAlchemyError) as e:
-            logger.error(f"Database error fetching pickup points for county {county}: {str(e)}")
+            logger.error("Database error fetching pickup points for county %s: %s", county, e)
             return {"message": "Database connection error or operation failed."}, 500
         except Exception as e:
-            logger.error(f"Error fetching pickup points for county {county}: {str(e)}", exc_info=True)
+            logger.error("Error fetching pickup points for county %s: %s", county, e, exc_info=True)
             return {"message": "Error fetching pickup points"}, 500
 
 class AdminPickupPointsResource(Resource):
@@ -310,10 +309,10 @@ class AdminPickupPointsResource(Resource):
             }, 200
 
         except (OperationalError, SQLAlchemyError) as e:
-            logger.error(f"Database error fetching admin pickup points: {str(e)}")
+            logger.error("Database error fetching admin pickup points: %s", e)
             return {"message": "Database connection error or operation failed."}, 500
         except Exception as e:
-            logger.error(f"Error fetching admin pickup points: {str(e)}", exc_info=True)
+            logger.error("Error fetching admin pickup points: %s", e, exc_info=True)
             return {"message": "Error fetching pickup points"}, 500
 
 
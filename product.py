@@ -8,7 +8,6 @@ import logging
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from decimal import Decimal
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +22,7 @@ class ProductResource(Resource):
                     return product.as_dict(), 200
                 return {"message": "Product not found"}, 404
             except (OperationalError, SQLAlchemyError) as e:
-                logger.error(f"Database error: {str(e)}")
+                logger.error("Database error: %s", e)
                 return {"message": "Database connection error"}, 500
         
         # Get query parameters for pagination and filtering
@@ -64,10 +63,10 @@ class ProductResource(Resource):
             }, 200
             
         except (OperationalError, SQLAlchemyError) as e:
-            logger.error(f"Database error: {str(e)}")
+            logger.error("Database error: %s", e)
             return {"message": "Database connection error"}, 500
         except Exception as e:
-            logger.error(f"Error fetching products: {str(e)}")
+            logger.error("Error fetching products: %s", e)
             return {"message": "Error fetching products"}, 500
 
     @jwt_required()
@@ -136,7 +135,7 @@ class ProductResource(Resource):
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error creating product: {str(e)}")
+            logger.error("Error creating product: %s", e)
             return {"error": str(e)}, 500
 
     @jwt_required()
@@ -204,7 +203,7 @@ class ProductResource(Resource):
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error updating product: {str(e)}")
+            logger.error("Error updating product: %s", e)
             return {"error": f"An error occurred: {str(e)}"}, 500
 
     @jwt_required()
@@ -227,7 +226,7 @@ class ProductResource(Resource):
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error deleting product id {product_id}: {str(e)}", exc_info=True)
+            logger.error("Error deleting product id %s: %s", product_id, e, exc_info=True)
             return {"error": "An unexpected error occurred during product deletion."}, 500
 
 
@@ -242,7 +241,7 @@ class ProductCategoryResource(Resource):
                 'categories': [category.as_dict() for category in categories]
             }, 200
         except Exception as e:
-            logger.error(f"Error fetching categories: {str(e)}")
+            logger.error("Error fetching categories: %s", e)
             return {"message": "Error fetching categories"}, 500
 
     @jwt_required()
@@ -274,7 +273,7 @@ class ProductCategoryResource(Resource):
             
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error creating category: {str(e)}")
+            logger.error("Error creating category: %s", e)
             return {"message": str(e)}, 400
 
 
@@ -307,7 +306,7 @@ class AdminProductsResource(Resource):
             }, 200
             
         except Exception as e:
-            logger.error(f"Error fetching admin products: {str(e)}")
+            logger.error("Error fetching admin products: %s", e)
             return {"message": "Error fetching products"}, 500
 
 
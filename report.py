@@ -1,14 +1,13 @@
-import json
 import uuid
 import io
 import os
 from flask import request, jsonify, send_file, make_response
 from flask_restful import Resource
 from datetime import datetime
-from model import db, Report, Order, OrderStatus, Product, Category, User, UserRole
+from model import db, Report, Order, OrderItem, OrderStatus, Product, Category, User, UserRole
 from flask_jwt_extended import jwt_required, get_jwt_identity
 import logging
-from sqlalchemy import func, cast, Numeric
+from sqlalchemy import select, func, desc
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from decimal import Decimal
 
@@ -25,9 +24,25 @@ from pdf_utils import (
 from email_utils import send_sales_report_email, EmailError, cleanup_temp_files
 import tempfile
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _category_name(category_id):
+    """Return a category's name without loading the Category row."""
+    return db.session.execute(
+        select(Category.name).where(Category.id == category_id)
+    ).scalar()
+
+
+def _category_names(category_ids):
+    """Map category id to name for a set of ids in one query."""
+    category_ids = {category_id for category_id in category_ids if category_id}
+    if not category_ids:
+        return {}
+    return dict(db.session.execute(
+        select(Category.id, Category.name).where(Category.id.in_(category_ids))
+    ).all())
+
 class ReportGenerationResource(Resource):
     """
     Resource for admins to generate and retrieve reports.
@@ -89,7 +104,7 @@ class ReportGenerationResource(Resource):
                 failed_payments=enhanced_data.get('failed_payments', 0),
                 summary=enhanced_data.get('summary'),
                 generated_by_user_id=current_user_id,
-                report_data=json.dumps(enhanced_data.get('chart_data', {}))  # Store extra chart data using report_data column
+                report_data=enhanced_data.get('chart_data', {})  # Store extra chart data using report_data column
             )
 
             db.session.add(new_report)
@@ -99,9 +114,9 @@ class ReportGenerationResource(Resource):
                 "message": "Report generated successfully",
                 "report_id": new_report.id,
                 "report_name": new_report.report_name,
-                "generated_at": new_report.generated_at.isoformat(),
-                "start_date": new_report.start_date.isoformat() if new_report.start_date else None,
-                "end_date": new_report.end_date.isoformat() if new_report.end_date else None,
+                "generated_at": new_report.generated_at,
+                "start_date": new_report.start_date,
+                "end_date": new_report.end_date,
                 "total_orders": new_report.total_orders,
                 "total_revenue": str(new_report.total_revenue),
                 "total_products_sold": new_report.total_products_sold,
@@ -110,85 +125,88 @@ class ReportGenerationResource(Resource):
 
             # Add category name if available
             if enhanced_data['top_selling_category_id']:
-                category = Category.query.get(enhanced_data['top_selling_category_id'])
-                if category:
-                    response_data['top_selling_category_name'] = category.name
+                category_name = _category_name(enhanced_data['top_selling_category_id'])
+                if category_name:
+                    response_data['top_selling_category_name'] = category_name
 
             return response_data, 201
 
         except OperationalError as e:
             db.session.rollback()
-            logger.error(f"Database operational error during report generation: {str(e)}")
+            logger.error("Database operational error during report generation: %s", e)
             return {"message": "Database connection error during report generation"}, 500
         except SQLAlchemyError as e:
             db.session.rollback()
-            logger.error(f"SQLAlchemy error during report generation: {str(e)}")
+            logger.error("SQLAlchemy error during report generation: %s", e)
             return {"message": "An error occurred with the database during report generation"}, 500
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Unexpected error during report generation: {str(e)}", exc_info=True)
+            logger.error("Unexpected error during report generation: %s", e, exc_info=True)
             return {"message": "An unexpected error occurred while generating the report"}, 500
 
     def _collect_enhanced_report_data(self, start_date, end_date):
         """
         Collect enhanced data for better chart generation and analytics.
-        """
-        # Base query for delivered orders
-        query = Order.query.filter_by(status=OrderStatus.DELIVERED)
 
+        Aggregates are computed in SQL over column tuples so no Order,
+        OrderItem, Product or Category instances are loaded.
+        """
+        # Base filter for delivered orders
+        conditions = [Order.status == OrderStatus.DELIVERED]
         if start_date:
-            query = query.filter(Order.created_at >= start_date)
+            conditions.append(Order.created_at >= start_date)
         if end_date:
-            query = query.filter(Order.created_at <= end_date)
-
-        orders = query.all()
-        total_orders = len(orders)
-        total_revenue = sum(order.total_amount for order in orders)
-
-        # Enhanced data collection
-        category_revenue = {}
-        category_quantities = {}
-        product_sales = {}
-        total_products_sold = 0
-
-        for order in orders:
-            for item in order.order_items:  # Assuming 'order_items' relationship
-                product = Product.query.get(item.product_id)
-                if product:
-                    # Product sales tracking
-                    product_name = product.name
-                    product_sales[product_name] = product_sales.get(product_name, 0) + item.quantity
-                    total_products_sold += item.quantity
-
-                    # Category tracking
-                    if product.category_id:
-                        category = Category.query.get(product.category_id)
-                        if category:
-                            category_name = category.name
-                            # Revenue by category
-                            item_revenue = float(item.quantity * item.unit_price)
-                            category_revenue[category_name] = category_revenue.get(category_name, 0) + item_revenue
-                            # Quantity by category
-                            category_quantities[category_name] = category_quantities.get(category_name, 0) + item.quantity
-
-        # Find top selling category
-        top_selling_category_id = None
-        if category_quantities:
-            top_category_name = max(category_quantities, key=category_quantities.get)
-            # Get category ID for database storage
-            top_category = Category.query.filter_by(name=top_category_name).first()
-            if top_category:
-                top_selling_category_id = top_category.id
+            conditions.append(Order.created_at <= end_date)
+
+        total_orders, total_revenue = db.session.execute(
+            select(func.count(Order.id), func.coalesce(func.sum(Order.total_amount), 0))
+            .where(*conditions)
+        ).one()
+
+        sold = func.sum(OrderItem.quantity).label('sold')
+        product_rows = db.session.execute(
+            select(Product.name, sold)
+            .select_from(OrderItem)
+            .join(Order, OrderItem.order_id == Order.id)
+            .join(Product, OrderItem.product_id == Product.id)
+            .where(*conditions)
+            .group_by(Product.name)
+            .order_by(desc('sold'))
+        ).all()
+        product_sales = {name: int(quantity) for name, quantity in product_rows}
+        total_products_sold = sum(product_sales.values())
+
+        category_rows = db.session.execute(
+            select(
+                Category.id,
+                Category.name,
+                func.sum(OrderItem.quantity * OrderItem.unit_price).label('revenue'),
+                sold,
+            )
+            .select_from(OrderItem)
+            .join(Order, OrderItem.order_id == Order.id)
+            .join(Product, OrderItem.product_id == Product.id)
+            .join(Category, Product.category_id == Category.id)
+            .where(*conditions)
+            .group_by(Category.id, Category.name)
+            .order_by(desc('sold'))
+        ).all()
+        category_revenue = {row.name: float(row.revenue) for row in category_rows}
+        category_quantities = {row.name: int(row.sold) for row in category_rows}
+
+        # Rows are ordered by quantity sold, so the first is the top category
+        top_selling_category_id = category_rows[0].id if category_rows else None
+        top_selling_category_name = category_rows[0].name if category_rows else None
 
         # Prepare chart data
         chart_data = {
             'revenue_by_category': category_revenue,
-            'top_products': dict(sorted(product_sales.items(), key=lambda x: x[1], reverse=True)[:20]),
+            'top_products': dict(list(product_sales.items())[:20]),
             'category_quantities': category_quantities,
             'total_orders': total_orders,
             'total_revenue': float(total_revenue),
             'total_products_sold': total_products_sold,
-            'top_selling_category_name': max(category_quantities, key=category_quantities.get) if category_quantities else None
+            'top_selling_category_name': top_selling_category_name
         }
 
         return {
@@ -220,9 +238,9 @@ class ReportGenerationResource(Resource):
                 report_data = {
                     "id": report.id,
                     "report_name": report.report_name,
-                    "generated_at": report.generated_at.isoformat(),
-                    "start_date": report.start_date.isoformat() if report.start_date else None,
-                    "end_date": report.end_date.isoformat() if report.end_date else None,
+                    "generated_at": report.generated_at,
+                    "start_date": report.start_date,
+                    "end_date": report.end_date,
                     "total_orders": report.total_orders,
                     "total_revenue": str(report.total_revenue),
                     "total_products_sold": report.total_products_sold,
@@ -231,21 +249,18 @@ class ReportGenerationResource(Resource):
 
                 # Add enhanced data if available
                 if report.report_data:
-                    try:
-                        enhanced_data = json.loads(report.report_data)
-                        report_data['chart_preview'] = {
-                            'categories_count': len(enhanced_data.get('revenue_by_category', {})),
-                            'top_products_count': len(enhanced_data.get('top_products', {})),
-                            'has_chart_data': True
-                        }
-                    except json.JSONDecodeError:
-                        logger.warning(f"Invalid report_data JSON for report {report_id}")
+                    enhanced_data = report.report_data
+                    report_data['chart_preview'] = {
+                        'categories_count': len(enhanced_data.get('revenue_by_category', {})),
+                        'top_products_count': len(enhanced_data.get('top_products', {})),
+                        'has_chart_data': True
+                    }
 
                 # Add top selling category name
                 if report.top_selling_category_id:
-                    category = Category.query.get(report.top_selling_category_id)
-                    if category:
-                        report_data['top_selling_category_name'] = category.name
+                    category_name = _category_name(report.top_selling_category_id)
+                    if category_name:
+                        report_data['top_selling_category_name'] = category_name
 
                 return report_data, 200
             else:
@@ -264,23 +279,26 @@ class ReportGenerationResource(Resource):
                         'current_page': page
                     }, 200
 
+                category_names = _category_names(
+                    report.top_selling_category_id for report in reports.items
+                )
+
                 reports_data = []
                 for report in reports.items:
                     report_dict = {
                         "id": report.id,
                         "report_name": report.report_name,
-                        "generated_at": report.generated_at.isoformat(),
-                        "start_date": report.start_date.isoformat() if report.start_date else None,
-                        "end_date": report.end_date.isoformat() if report.end_date else None,
+                        "generated_at": report.generated_at,
+                        "start_date": report.start_date,
+                        "end_date": report.end_date,
                         "total_orders": report.total_orders,
                         "total_revenue": str(report.total_revenue),
                         "total_products_sold": report.total_products_sold,
                         "top_selling_category_id": report.top_selling_category_id
                     }
-                    if report.top_selling_category_id:
-                        category = Category.query.get(report.top_selling_category_id)
-                        if category:
-                            report_dict['top_selling_category_name'] = category.name
+                    category_name = category_names.get(report.top_selling_category_id)
+                    if category_name:
+                        report_dict['top_selling_category_name'] = category_name
                     reports_data.append(report_dict)
 
                 return {
@@ -291,13 +309,13 @@ class ReportGenerationResource(Resource):
                 }, 200
 
         except OperationalError as e:
-            logger.error(f"Database operational error during report retrieval: {str(e)}")
+            logger.error("Database operational error during report retrieval: %s", e)
             return {"message": "Database connection error during report retrieval"}, 500
         except SQLAlchemyError as e:
-            logger.error(f"SQLAlchemy error during report retrieval: {str(e)}")
+            logger.error("SQLAlchemy error during report retrieval: %s", e)
             return {"message": "An error occurred with the database during report retrieval"}, 500
         except Exception as e:
-            logger.error(f"Unexpected error during report retrieval: {str(e)}", exc_info=True)
+            logger.error("Unexpected error during report retrieval: %s", e, exc_info=True)
             return {"message": "An unexpected error occurred while retrieving reports"}, 500
 
 class ReportPDFResource(Resource):
@@ -348,7 +366,7 @@ class ReportPDFResource(Resource):
             try:
                 os.remove(result_path)
             except Exception as e:
-                logger.warning(f"Could not remove temporary PDF file: {e}")
+                logger.warning("Could not remove temporary PDF file: %s", e)
 
             return send_file(
                 pdf_buffer,
@@ -358,7 +376,7 @@ class ReportPDFResource(Resource):
             )
 
         except Exception as e:
-            logger.error(f"Error generating enhanced PDF report: {str(e)}", exc_info=True)
+            logger.error("Error generating enhanced PDF report: %s", e, exc_info=True)
             return {"message": "An error occurred while generating the enhanced PDF report"}, 500
 
     def _prepare_comprehensive_report_data(self, report):
@@ -377,21 +395,16 @@ class ReportPDFResource(Resource):
 
         # Add top selling category name
         if report.top_selling_category_id:
-            category = Category.query.get(report.top_selling_category_id)
-            if category:
-                report_data['top_selling_category_name'] = category.name
+            report_data['top_selling_category_name'] = _category_name(report.top_selling_category_id)
 
         # Add enhanced data if available
         if report.report_data:
-            try:
-                enhanced_data = json.loads(report.report_data)
-                report_data.update({
-                    'revenue_by_category': enhanced_data.get('revenue_by_category', {}),
-                    'top_products': enhanced_data.get('top_products', {}),
-                    'category_quantities': enhanced_data.get('category_quantities', {})
-                })
-            except json.JSONDecodeError:
-                logger.warning(f"Could not parse report_data for report {report.id}")
+            enhanced_data = report.report_data
+            report_data.update({
+                'revenue_by_category': enhanced_data.get('revenue_by_category', {}),
+                'top_products': enhanced_data.get('top_products', {}),
+                'category_quantities': enhanced_data.get('category_quantities', {})
+            })
 
         return report_data
 
@@ -465,10 +478,10 @@ class ReportEmailResource(Resource):
                 return {"message": "Failed to send email"}, 500
 
         except EmailError as e:
-            logger.error(f"Email error: {str(e)}")
+            logger.error("Email error: %s", e)
             return {"message": f"Email error: {str(e)}"}, 500
         except Exception as e:
-            logger.error(f"Error sending enhanced report email: {str(e)}", exc_info=True)
+            logger.error("Error sending enhanced report email: %s", e, exc_info=True)
             return {"message": "An error occurred while sending the enhanced report email"}, 500
         finally:
             # Clean up temporary file
@@ -525,7 +538,7 @@ class ReportChartsResource(Resource):
             try:
                 os.remove(result_path)
             except Exception as e:
-                logger.warning(f"Could not remove temporary chart file: {e}")
+                logger.warning("Could not remove temporary chart file: %s", e)
 
             return send_file(
                 chart_buffer,
@@ -535,7 +548,7 @@ class ReportChartsResource(Resource):
             )
 
         except Exception as e:
-            logger.error(f"Error generating {chart_type} chart: {str(e)}", exc_info=True)
+            logger.error("Error generating %s chart: %s", chart_type, e, exc_info=True)
             return {"message": f"An error occurred while generating the {chart_type} chart"}, 500
 
 class UserOrderHistoryResource(Resource):
@@ -556,7 +569,9 @@ class UserOrderHistoryResource(Resource):
 
         try:
             # Get user's orders, sorted by creation date for better history representation
-            orders = Order.query.filter_by(user_id=current_user_id).order_by(Order.created_at.desc()).all()
+            orders = Order.with_items_query().filter_by(
+                user_id=current_user_id
+            ).order_by(Order.created_at.desc()).all()
             order_history = []
 
             for order in orders:
@@ -569,7 +584,7 @@ class UserOrderHistoryResource(Resource):
                 }
 
                 for item in order.order_items:
-                    product = Product.query.get(item.product_id)
+                    product = item.product
                     if product:
                         order_data['items'].append({
                             'name': product.name,
@@ -602,7 +617,7 @@ class UserOrderHistoryResource(Resource):
             try:
                 os.remove(result_path)
             except Exception as e:
-                logger.warning(f"Could not remove temporary file: {e}")
+                logger.warning("Could not remove temporary file: %s", e)
 
             return send_file(
                 pdf_buffer,
@@ -612,7 +627,7 @@ class UserOrderHistoryResource(Resource):
             )
 
         except Exception as e:
-            logger.error(f"Error generating order history PDF for user {current_user_id}: {str(e)}", exc_info=True)
+            logger.error("Error generating order history PDF for user %s: %s", current_user_id, e, exc_info=True)
             return {"message": "An error occurred while generating your order history PDF"}, 500
 
 